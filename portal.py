@@ -1,14 +1,31 @@
+import argparse
+import hashlib
 import io
+import json
+import multiprocessing
+import os
+import queue
 import re
+import shutil
+import signal
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 from tkinter import (
-    Tk, Canvas, Text, Button, Label, Frame, Scrollbar, messagebox, END, filedialog,
+    Tk, Toplevel, Canvas, Text, Button, Label, Frame, Scrollbar, Entry, Listbox, messagebox, END, filedialog,
     VERTICAL, RIGHT, Y, LEFT, BOTH
 )
-from tkinter.ttk import Combobox
-from PIL import Image, ImageTk
-import mysql.connector
+from tkinter.ttk import Combobox, Progressbar
+from PIL import Image, ImageChops, ImageTk
+from mysql.connector import pooling
 import fitz  # PyMuPDF
 
 # Define the path for assets. Please update this path
@@ -17,6 +34,1933 @@ import fitz  # PyMuPDF
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"C:\DataAnalysis\Projects\pdfreader\TkinterConverison\build\assets\frame0")
 
+# MySQL settings; override with HSE_DB_* environment variables (e.g. to point at a local test server)
+DB_CONFIG = {
+    'host': os.environ.get("HSE_DB_HOST", "localhost"),
+    'port': int(os.environ.get("HSE_DB_PORT", "3306")),
+    'user': os.environ.get("HSE_DB_USER", "root"),
+    'password': os.environ.get("HSE_DB_PASSWORD", "password"),
+    'database': os.environ.get("HSE_DB_NAME", "project"),
+    'connection_timeout': int(os.environ.get("HSE_DB_TIMEOUT", "5")), # Seconds before falling back to local caches
+}
+DB_POOL_SIZE = int(os.environ.get("HSE_DB_POOL_SIZE", "4"))
+
+# Local cache for derived data (thumbnails etc.); override with HSE_PORTAL_CACHE_DIR.
+# Everything in it can be rebuilt, so failing to write there is never an error.
+CACHE_DIR = Path(os.environ.get("HSE_PORTAL_CACHE_DIR", Path.home() / ".hse_report_portal"))
+SIGNATURE_CACHE_DIR = CACHE_DIR / "signatures"
+OFFICER_NAMES_CACHE_PATH = CACHE_DIR / "officer_names.json"
+SIGNATURE_SLOT_CACHE_PATH = CACHE_DIR / "signature_slots_v2.json" # v1 keyed one layout per fingerprint
+REPORT_CATALOG_PATH = CACHE_DIR / "report_catalog.sqlite3"
+# Folders the report catalog indexes, separated by os.pathsep; folders of opened reports are added as well
+REPORT_DIRS = [Path(p) for p in os.environ.get("HSE_REPORT_DIRS", "").split(os.pathsep) if p]
+
+# Rendered page bitmaps are cached per zoom level; zoom factors are snapped to this
+# many steps per 1.0 so that zooming in and back out lands on the same cache key.
+ZOOM_QUANTUM = 1000
+PAGE_RENDER_CACHE_MAX_BYTES = 256 * 1024 * 1024 # Memory budget for cached page bitmaps
+RENDER_COALESCE_DELAY_S = 0.06 # Quiet period that lets a burst of zoom clicks collapse into one render
+UI_QUEUE_POLL_MS = 30 # How often the Tk thread picks up results posted by background workers
+PAGE_OBJECT_CACHE_PAGES = 8 # Loaded fitz.Page objects a DocumentSession keeps
+DISPLAY_LIST_CACHE_PAGES = 4 # Recorded page contents kept for re-rendering at another zoom or clip
+
+# Pages whose full bitmap would exceed this many pixels are rendered as viewport-sized tiles instead
+TILED_RENDER_MIN_PIXELS = 4_000_000
+TILE_SIZE_PX = 512
+TILE_MARGIN_PX = 256 # Extra area rendered around the visible region so short pans are already covered
+TILE_UPDATE_DELAY_MS = 80 # Debounce for fetching new tiles while the user drags the page
+
+# Progressive rendering: a page with nothing cached first gets a cheap pass at this zoom
+# (~36 DPI), shown stretched to the requested size until the sharp render arrives.
+PROGRESSIVE_PREVIEW_ZOOM = 0.5
+
+
+def quantize_zoom(zoom):
+    """Snaps a zoom factor to the render cache grid."""
+    return round(zoom * ZOOM_QUANTUM) / ZOOM_QUANTUM
+
+
+def document_cache_key(path):
+    """Identifies a PDF on disk by resolved path, modification time and size."""
+    stat = os.stat(path)
+    return (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+# Default e-sign slot per officer role (X from left, Y from BOTTOM in PDF points). Auto-placement
+# detects the slots from the role labels printed on the page and only falls back to this table
+# (built for the daily report template) when a page has no searchable labels.
+ESIGN_COORDINATES = {
+    "Initiated By": (81.6, 123.7),
+    "Verified By": (176.0, 121.3),
+    "Checked By 1": (272.0, 118.1),
+    "Checked By 2": (368.8, 119.7),
+    "Checked By 3": (462.4, 121.3),
+    "Reviewed By Officer 1": (105.6, 38.1),
+    "Reviewed By Officer 2": (240.8, 37.3),
+    "Approved By": (408.0, 44.5)
+}
+
+# Role labels searched for on a page, and the roles they stand for from left to right
+SIGNATURE_SLOT_LABELS = [
+    ("Initiated by", ["Initiated By"]),
+    ("Verified by", ["Verified By"]),
+    ("Checked by", ["Checked By 1", "Checked By 2", "Checked By 3"]),
+    ("Reviewed by", ["Reviewed By Officer 1", "Reviewed By Officer 2"]),
+    ("Approved by", ["Approved By"])
+]
+# Every role a signature can be placed for, in form order
+SIGNATURE_ROLES = [role for _, roles in SIGNATURE_SLOT_LABELS for role in roles]
+# A detected signature is centred under its label with its bottom edge this far below the label,
+# which puts it over the officer's printed name like the default table does
+SIGNATURE_SLOT_DROP_PT = 45
+SIGNATURE_SLOT_LAYOUTS_PER_FINGERPRINT = 4 # Templates sharing fonts and images keep separate cached layouts
+
+# Signatures are always placed SIG_TARGET_WIDTH_PT wide, so they are ingested once at a fixed
+# resolution for that box instead of carrying the full-size scan around
+SIG_TARGET_WIDTH_PT = 80
+SIGNATURE_OUTPUT_DPI = int(os.environ.get("HSE_SIGNATURE_DPI", "200"))
+SIGNATURE_TRIM_THRESHOLD = 235 # Grey level above which scan pixels count as paper when trimming margins
+SIGNATURE_TRIM_PADDING_PX = 4
+SIGNATURE_PALETTE_COLORS = 64 # Colours kept in the compact PNG (ink plus anti-aliasing)
+
+SIGNATURE_CACHE_MAX_BYTES = 64 * 1024 * 1024 # Budget for decoded, raw and preview copies of loaded e-signs
+SCALED_SIGNATURE_CACHE_MAX_ENTRIES = 128 # Resized signature variants kept for overlays, previews and saving
+SIGNATURE_DISK_CACHE_MAX_BYTES = 32 * 1024 * 1024 # Ingested e-signs kept on disk; least recently used officers go first
+
+# Page thumbnail sidebar
+THUMBNAIL_WIDTH_PX = 100
+THUMBNAIL_SLOT_PADDING_PX = 24 # Room around each thumbnail for its page number
+THUMBNAIL_CHUNK_PAGES = 4 # Pages rendered per process-pool task
+THUMBNAIL_MAX_PROCESSES = max(1, min(4, os.cpu_count() or 1))
+THUMBNAIL_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024 # Thumbnails kept on disk; least recently opened reports go first
+
+# In-document search; word boxes are extracted in the thumbnail process pool and cached on disk by file hash
+TEXT_INDEX_VERSION = 1 # Bump when the cached layout changes so stale indexes are rebuilt
+TEXT_INDEX_CHUNK_PAGES = 16 # Pages extracted per process-pool task
+TEXT_SEARCH_MAX_HITS = 500
+TEXT_SEARCH_STRIP_CHARS = ".,:;!?()[]{}\"'“”‘’" # Punctuation ignored at the ends of words and search terms
+
+
+def file_sha1(path, chunk_size=1024 * 1024):
+    """Content hash of a file, used to key on-disk caches so renamed or copied reports still hit."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_file_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def prune_disk_cache(root, max_bytes, keep=None):
+    """
+    Deletes the least recently used entries (files, or folders with everything in them) directly
+    under root until the rest fits in max_bytes. Recency is the entry's mtime; keep is never deleted.
+    """
+    entries = []
+    for path in Path(root).glob("*"):
+        try:
+            files = [f for f in path.rglob("*") if f.is_file()] if path.is_dir() else [path]
+            entries.append((path.stat().st_mtime, sum(f.stat().st_size for f in files), path))
+        except OSError:
+            continue # Removed by another process meanwhile
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink(missing_ok=True)
+        except OSError:
+            continue # In use or not ours to delete; counted as kept
+        total -= size
+
+
+def thumbnail_cache_path(file_hash, page_num, width_px=THUMBNAIL_WIDTH_PX):
+    return CACHE_DIR / "thumbnails" / file_hash / f"{page_num}_{width_px}.png"
+
+
+def render_thumbnails(path, file_hash, page_nums, width_px=THUMBNAIL_WIDTH_PX):
+    """
+    Process-pool worker: opens its own fitz document, renders low-DPI thumbnails of page_nums,
+    stores them in the on-disk thumbnail cache and returns [(page_num, png_bytes), ...].
+    """
+    results = []
+    doc = fitz.open(path)
+    try:
+        for page_num in page_nums:
+            page = doc.load_page(page_num)
+            zoom = width_px / page.rect.width
+            png_bytes = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom)).tobytes("png")
+            try:
+                _write_file_atomic(thumbnail_cache_path(file_hash, page_num, width_px), png_bytes)
+            except OSError:
+                pass
+            results.append((page_num, png_bytes))
+    finally:
+        doc.close()
+    return results
+
+
+def text_index_cache_path(file_hash):
+    return CACHE_DIR / "text_index" / f"{file_hash}_v{TEXT_INDEX_VERSION}.json"
+
+
+def extract_page_words(path, page_nums):
+    """
+    Process-pool worker: returns [(page_num, [[x0, y0, x1, y1, word], ...]), ...] in block/line order
+    (MuPDF's own order; sort=True costs about ten times as much and phrases stay together without it).
+    Boxes are in displayed page points (top-left origin, page rotation applied), like the canvas.
+    """
+    results = []
+    doc = fitz.open(path)
+    try:
+        for page_num in page_nums:
+            page = doc.load_page(page_num)
+            rotation_matrix = page.rotation_matrix
+            words = []
+            for x0, y0, x1, y1, word, *_ in page.get_text("words"):
+                box = fitz.Rect(x0, y0, x1, y1) * rotation_matrix
+                words.append([round(box.x0, 2), round(box.y0, 2), round(box.x1, 2), round(box.y1, 2), word])
+            results.append((page_num, words))
+    finally:
+        doc.close()
+    return results
+
+
+class TextIndex:
+    """Word boxes of every page of one document; searching never touches fitz."""
+
+    def __init__(self, pages):
+        self.pages = pages # page_num -> [[x0, y0, x1, y1, word], ...]
+        # page_num -> ([folded word, ...], [word box, ...]); words without a letter or digit
+        # (":", "-", "|") are left out, so they never break a phrase
+        self.folded = []
+        for words in pages:
+            kept = [
+                (folded, word) for folded, word in ((self.fold(word[4]), word) for word in words)
+                if any(char.isalnum() for char in folded)
+            ]
+            self.folded.append(([folded for folded, _ in kept], [word for _, word in kept]))
+
+    @staticmethod
+    def fold(word):
+        """Search form of a word: case-folded, without surrounding punctuation ("By:" -> "by")."""
+        return word.casefold().strip(TEXT_SEARCH_STRIP_CHARS)
+
+    @classmethod
+    def load(cls, path):
+        try:
+            return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, path):
+        try:
+            _write_file_atomic(path, json.dumps(self.pages, separators=(",", ":")).encode("utf-8"))
+        except OSError:
+            pass
+
+    def search(self, query, limit=TEXT_SEARCH_MAX_HITS):
+        """
+        Case-insensitive hits for query in page order, as [(page_num, [word box, ...]), ...].
+        Punctuation around words and terms (see fold()) and words that are only punctuation are
+        ignored. A single term matches inside a word ("0012" finds "INC-2024-0012"); several terms
+        must be consecutive words, the first ending and the last starting with its term
+        ("approved by" finds "Approved : By:").
+        """
+        terms = [term for term in map(self.fold, query.split()) if any(char.isalnum() for char in term)]
+        if not terms:
+            return []
+        hits = []
+        for page_num, (words, boxes) in enumerate(self.folded):
+            for i in range(len(words) - len(terms) + 1):
+                if len(terms) == 1:
+                    matched = terms[0] in words[i]
+                else:
+                    last = i + len(terms) - 1
+                    matched = (
+                        words[i].endswith(terms[0]) and words[last].startswith(terms[-1])
+                        and words[i + 1:last] == terms[1:-1]
+                    )
+                if matched:
+                    hits.append((page_num, [box[:4] for box in boxes[i:i + len(terms)]]))
+                    if len(hits) >= limit:
+                        return hits
+        return hits
+
+
+class DocumentSession:
+    """
+    One open PDF. Page geometry is read for every page at open(), so size lookups never load a
+    page again; loaded fitz.Page objects and display lists are kept in small LRUs, so re-rendering
+    a page at another zoom or clip replays its recorded contents instead of re-parsing the content
+    stream. Like fitz itself, not thread-safe.
+    """
+
+    def __init__(self, max_pages=PAGE_OBJECT_CACHE_PAGES, max_display_lists=DISPLAY_LIST_CACHE_PAGES):
+        self.max_pages = max_pages
+        self.max_display_lists = max_display_lists
+        self.path = None
+        self.doc = None
+        self.doc_key = None # document_cache_key() of the open file
+        self.page_rects = [] # page_num -> fitz.Rect of the page as displayed (rotation applied)
+        self._pages = OrderedDict() # page_num -> fitz.Page, least recently used first
+        self._display_lists = OrderedDict() # page_num -> fitz.DisplayList, least recently used first
+
+    def open(self, path):
+        self.close()
+        self.doc = fitz.open(path)
+        self.path = path
+        self.doc_key = document_cache_key(path)
+        # Loading a page object reads its dictionary only; content streams are parsed on first render
+        self.page_rects = [self.doc.load_page(page_num).rect for page_num in range(self.doc.page_count)]
+        return self.doc
+
+    def close(self):
+        self._display_lists.clear()
+        self._pages.clear()
+        if self.doc is not None and not self.doc.is_closed:
+            self.doc.close()
+        self.doc = self.path = self.doc_key = None
+        self.page_rects = []
+
+    def release_file(self):
+        """
+        Swaps the open file for an in-memory copy of its bytes, so the file itself can be replaced
+        (Windows refuses to replace a file that is still open). Page geometry is kept.
+        """
+        data = Path(self.path).read_bytes()
+        self._display_lists.clear()
+        self._pages.clear()
+        self.doc.close()
+        self.doc = fitz.open(stream=data, filetype="pdf")
+
+    @staticmethod
+    def _lru_get(entries, key, max_entries, create):
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+            return value
+        value = entries[key] = create()
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+        return value
+
+    def page(self, page_num):
+        return self._lru_get(self._pages, page_num, self.max_pages, lambda: self.doc.load_page(page_num))
+
+    def page_rect(self, page_num):
+        return self.page_rects[page_num]
+
+    def page_height(self, page_num):
+        return self.page_rects[page_num].height
+
+    def display_list(self, page_num):
+        return self._lru_get(
+            self._display_lists, page_num, self.max_display_lists, lambda: self.page(page_num).get_displaylist()
+        )
+
+    def render(self, page_num, zoom, clip=None):
+        """fitz.Pixmap of a page at zoom, limited to clip (fitz.Rect in page points) if given."""
+        return self.display_list(page_num).get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip)
+
+
+# DocumentSession opened inside a render worker process, keyed by document_cache_key()
+_worker_documents = {}
+
+
+def _close_worker_documents():
+    for document in _worker_documents.values():
+        document.close()
+    _worker_documents.clear()
+
+
+def _open_worker_document(path, doc_key):
+    document = _worker_documents.get(doc_key)
+    if document is None:
+        # Only the most recently requested document is kept open in the worker
+        _close_worker_documents()
+        document = _worker_documents[doc_key] = DocumentSession()
+        document.open(path)
+    return document
+
+
+def rasterize_page(path, doc_key, page_num, zoom, clip=None):
+    """
+    Renders one page inside a worker process and returns (width, height, RGB samples).
+    clip is an optional (x0, y0, x1, y1) rectangle in PDF points limiting the rendered area.
+    Tiles, previews and zoom steps of a page share its cached display list.
+    """
+    pix = _open_worker_document(path, doc_key).render(page_num, zoom, fitz.Rect(clip) if clip else None)
+    return pix.width, pix.height, pix.samples
+
+
+def tile_clip_rect(col, row, zoom):
+    """PDF-point rectangle covered by tile (col, row) at the given zoom."""
+    return (
+        col * TILE_SIZE_PX / zoom, row * TILE_SIZE_PX / zoom,
+        (col + 1) * TILE_SIZE_PX / zoom, (row + 1) * TILE_SIZE_PX / zoom
+    )
+
+
+class PageRenderWorker:
+    """
+    Rasterizes pages away from the Tk thread.
+    A dispatcher thread feeds a single worker process (PyMuPDF holds the GIL while rendering,
+    so a plain thread would still freeze the window). Submitting a superseding job makes every
+    queued and in-flight job stale; stale results are dropped instead of being delivered.
+    """
+
+    def __init__(self, on_result, coalesce_delay_s=RENDER_COALESCE_DELAY_S):
+        self.on_result = on_result # Called from the dispatcher thread as on_result(job, result, error)
+        self.coalesce_delay_s = coalesce_delay_s
+        self._cond = threading.Condition()
+        self._pending = []
+        self._generation = 0
+        self._last_submit_time = 0.0
+        self._executor = None
+        self._closed = False
+        self._paused = False # Set by pause(): queued jobs wait until resume()
+        self._busy = False # A job has been taken off the queue and is not finished yet
+        self._thread = threading.Thread(target=self._run, name="page-render-dispatcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, job, supersede=True):
+        """
+        Queues a render job (dict with path, doc_key, page_num, zoom and optional clip/tile) and returns its generation.
+        Jobs flagged 'keep_if_stale' are still delivered after being superseded mid-render, since their
+        bitmaps remain valid cache entries.
+        """
+        with self._cond:
+            if supersede:
+                self._generation += 1
+                self._pending.clear()
+            job['generation'] = self._generation
+            self._pending.append(job)
+            self._last_submit_time = time.monotonic()
+            self._cond.notify()
+        return job['generation']
+
+    def is_current(self, job):
+        return job['generation'] == self._generation
+
+    def pause(self):
+        """
+        Holds back queued jobs until resume(), waits for the job in flight and closes the documents
+        open in the worker process, so their files can be replaced. Blocks; call off the Tk thread.
+        """
+        with self._cond:
+            self._paused = True
+            while self._busy:
+                self._cond.wait()
+            executor = self._executor
+        if executor is not None:
+            try:
+                executor.submit(_close_worker_documents).result()
+            except Exception:
+                pass # A dead worker process holds no files
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _next_job(self):
+        with self._cond:
+            while True:
+                while (not self._pending or self._paused) and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return None
+                # Wait until submissions have been quiet for coalesce_delay_s so only the last of a burst renders
+                remaining = self._last_submit_time + self.coalesce_delay_s - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                job = self._pending.pop(0)
+                if self.is_current(job):
+                    self._busy = True
+                    return job
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            result, error = None, None
+            try:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=1)
+                future = self._executor.submit(
+                    rasterize_page, job['path'], job['doc_key'], job['page_num'], job['zoom'], job.get('clip')
+                )
+                result = future.result()
+            except BrokenProcessPool as e:
+                self._executor = None # Start a fresh worker process for the next job
+                error = e
+            except Exception as e:
+                error = e
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+            if (self.is_current(job) or job.get('keep_if_stale')) and not self._closed:
+                self.on_result(job, result, error)
+
+
+class OfficerRepository:
+    """
+    Data access for the iocl officer table.
+    All queries share one MySQL connection pool, so repeated lookups reuse an
+    authenticated connection instead of opening a new TCP session each time.
+    Pass connect= (a zero-argument callable returning a DB-API connection with
+    ping()) to use another connection source, e.g. an in-memory stand-in.
+    """
+
+    def __init__(self, db_config=None, pool_size=DB_POOL_SIZE, pool_name="hse_portal", connect=None):
+        self.db_config = dict(db_config or DB_CONFIG)
+        self.pool_size = pool_size
+        self.pool_name = pool_name
+        self._connect = connect or self._pooled_connection
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        # Created on first use so the app still starts when the server is down
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = pooling.MySQLConnectionPool(
+                    pool_name=self.pool_name, pool_size=self.pool_size, pool_reset_session=True, **self.db_config
+                )
+            return self._pool
+
+    def _pooled_connection(self):
+        return self._get_pool().get_connection()
+
+    @contextmanager
+    def connection(self):
+        """Borrows a pooled connection, making sure it is still alive before handing it out."""
+        conn = self._connect()
+        try:
+            # Health check: transparently reconnect if the server dropped the idle connection
+            conn.ping(reconnect=True, attempts=2, delay=0)
+            yield conn
+        finally:
+            conn.close() # Returns the connection to the pool
+
+    def _query(self, sql, params=()):
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(sql, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def _query_names(self, sql, names):
+        """Runs sql with its {placeholders} expanded to one %s per distinct name; returns the rows."""
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        return self._query(sql.format(placeholders=", ".join(["%s"] * len(names))), names)
+
+    def fetch_officer_names(self):
+        return [row[0] for row in self._query("SELECT name FROM iocl ORDER BY empid ASC")]
+
+    def fetch_esigns(self, names):
+        """Fetches several officers' ESIGN images with one IN (...) query; returns {name: image bytes}."""
+        rows = self._query_names("SELECT name, ESIGN FROM iocl WHERE name IN ({placeholders})", names)
+        return {name: bytes(esign) for name, esign in rows if esign}
+
+    def fetch_esign_hashes(self, names):
+        """Cheap metadata query: {name: MD5 hex of the ESIGN BLOB}, computed server-side without transferring images."""
+        rows = self._query_names(
+            "SELECT name, MD5(ESIGN) FROM iocl WHERE name IN ({placeholders}) AND ESIGN IS NOT NULL", names
+        )
+        return {name: content_hash for name, content_hash in rows if content_hash}
+
+    def check(self):
+        """
+        Borrows a connection twice and runs a trivial query each time, so a
+        misconfigured pool or a failing reconnect shows up as an exception.
+        Returns the number of officers.
+        """
+        for _ in range(2):
+            self._query("SELECT 1")
+        return self._query("SELECT COUNT(*) FROM iocl")[0][0]
+
+
+def decode_signature_image(img_bytes):
+    """Decodes a stored ESIGN BLOB into an RGBA PIL image."""
+    return Image.open(io.BytesIO(img_bytes)).convert("RGBA")
+
+
+def ingest_signature(img_bytes, output_dpi=SIGNATURE_OUTPUT_DPI, box_width_pt=SIG_TARGET_WIDTH_PT):
+    """
+    Normalizes a scanned ESIGN BLOB for use in the portal.
+    Trims blank (white or transparent) margins, downsamples to output_dpi for a box_width_pt
+    wide placement and pre-encodes a compact palette PNG.
+    Returns (encoded_png_bytes, rgba_pil_img).
+    """
+    pil_img = decode_signature_image(img_bytes)
+
+    # Ink = visible pixels darker than paper; crop to its bounding box plus a little padding
+    ink_mask = pil_img.convert("L").point(lambda v: 255 if v < SIGNATURE_TRIM_THRESHOLD else 0)
+    ink_mask = ImageChops.multiply(ink_mask, pil_img.getchannel("A"))
+    bbox = ink_mask.getbbox()
+    if bbox:
+        pil_img = pil_img.crop((
+            max(0, bbox[0] - SIGNATURE_TRIM_PADDING_PX), max(0, bbox[1] - SIGNATURE_TRIM_PADDING_PX),
+            min(pil_img.width, bbox[2] + SIGNATURE_TRIM_PADDING_PX), min(pil_img.height, bbox[3] + SIGNATURE_TRIM_PADDING_PX)
+        ))
+
+    target_width_px = max(1, round(box_width_pt / 72 * output_dpi))
+    if pil_img.width > target_width_px:
+        target_height_px = max(1, round(pil_img.height * target_width_px / pil_img.width))
+        pil_img = pil_img.resize((target_width_px, target_height_px), Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    pil_img.quantize(colors=SIGNATURE_PALETTE_COLORS, method=Image.FASTOCTREE).save(buffer, format="PNG", optimize=True)
+    encoded_bytes = buffer.getvalue()
+    # Work from the decoded compact variant so previews and saved PDFs show exactly what is cached
+    return encoded_bytes, decode_signature_image(encoded_bytes)
+
+
+class SignatureDiskCache:
+    """
+    Ingested e-signs (compact PNGs from ingest_signature) on local disk, keyed by officer, the
+    MD5 of their ESIGN BLOB and the ingest resolution. A changed BLOB has a new hash, so an outdated file is never served
+    while the database is reachable; older versions are pruned when a new one is stored.
+    """
+
+    def __init__(self, cache_dir=SIGNATURE_CACHE_DIR, max_bytes=SIGNATURE_DISK_CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _name_prefix(name):
+        return hashlib.sha1(name.encode("utf-8")).hexdigest()[:16]
+
+    def path_for(self, name, content_hash):
+        return self.cache_dir / f"{self._name_prefix(name)}_{content_hash}_{SIGNATURE_OUTPUT_DPI}dpi.png"
+
+    def _read(self, path):
+        png_bytes = path.read_bytes()
+        return png_bytes, Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+
+    def load(self, name, content_hash):
+        """Returns (png_bytes, pil_img) for this exact signature version, or None."""
+        path = self.path_for(name, content_hash)
+        try:
+            if not path.exists():
+                return None
+            os.utime(path) # Marks the officer as recently used for prune_disk_cache()
+            return self._read(path)
+        except OSError:
+            return None
+
+    def load_latest(self, name):
+        """Most recently stored version of an officer's signature, for use while the database is unreachable."""
+        candidates = sorted(self.cache_dir.glob(f"{self._name_prefix(name)}_*.png"), key=lambda p: p.stat().st_mtime)
+        for path in reversed(candidates):
+            try:
+                return self._read(path)
+            except OSError:
+                continue
+        return None
+
+    def store(self, name, content_hash, encoded_bytes):
+        path = self.path_for(name, content_hash)
+        try:
+            _write_file_atomic(path, encoded_bytes)
+            for old_path in self.cache_dir.glob(f"{self._name_prefix(name)}_*.png"):
+                if old_path != path:
+                    old_path.unlink(missing_ok=True)
+            prune_disk_cache(self.cache_dir, self.max_bytes, keep=path)
+        except OSError:
+            pass
+
+
+def load_signatures(repository, disk_cache, names):
+    """
+    Resolves officers' e-signs, preferring the on-disk cache.
+    A cheap MD5(ESIGN) query revalidates cached files, so only new or changed BLOBs are
+    downloaded. If the database cannot be reached, the last cached version of each
+    signature is served instead (read-only mode).
+    Returns ({name: (encoded_png_bytes, pil_img)}, [error messages]).
+    """
+    names = list(dict.fromkeys(names))
+    signatures, errors = {}, []
+    try:
+        hashes = repository.fetch_esign_hashes(names)
+    except Exception as e:
+        for name in names:
+            cached = disk_cache.load_latest(name)
+            if cached is not None:
+                signatures[name] = cached
+        errors.append(f"Database unavailable ({e}); using {len(signatures)} locally cached signature(s).")
+        return signatures, errors
+
+    to_download = []
+    for name in names:
+        if name not in hashes:
+            continue # No e-sign stored for this officer
+        cached = disk_cache.load(name, hashes[name])
+        if cached is not None:
+            signatures[name] = cached
+        else:
+            to_download.append(name)
+
+    if to_download:
+        try:
+            downloaded = repository.fetch_esigns(to_download)
+        except Exception as e:
+            downloaded = {}
+            errors.append(f"DB Error fetching signatures: {e}")
+            for name in to_download:
+                cached = disk_cache.load_latest(name)
+                if cached is not None:
+                    signatures[name] = cached
+        for name, img_bytes in downloaded.items():
+            try:
+                encoded_bytes, pil_img = ingest_signature(img_bytes)
+            except Exception as e:
+                errors.append(f"Could not decode signature for '{name}': {e}")
+                continue
+            disk_cache.store(name, hashlib.md5(img_bytes).hexdigest(), encoded_bytes)
+            signatures[name] = (encoded_bytes, pil_img)
+    return signatures, errors
+
+
+def load_cached_officer_names():
+    try:
+        return json.loads(OFFICER_NAMES_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_officer_names(names):
+    try:
+        _write_file_atomic(OFFICER_NAMES_CACHE_PATH, json.dumps(names).encode("utf-8"))
+    except OSError:
+        pass
+
+
+class SignatureCache:
+    """
+    Size-bounded LRU of loaded e-signs: {name: {'pil_img', 'tk_img', 'name', 'image_bytes'}}.
+    Each entry is charged for its decoded RGBA image, its raw bytes and its Tk preview, and
+    least recently used officers are evicted once max_bytes is exceeded.
+    Only used from the Tk thread (background loaders post their results there first).
+    """
+
+    def __init__(self, max_bytes=SIGNATURE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict() # name -> (entry, size_bytes)
+
+    @staticmethod
+    def estimate_bytes(entry):
+        size = len(entry.get('image_bytes') or b"")
+        if entry.get('pil_img') is not None:
+            size += entry['pil_img'].width * entry['pil_img'].height * 4
+        if entry.get('tk_img') is not None:
+            size += entry['tk_img'].width() * entry['tk_img'].height() * 4
+        return size
+
+    def __contains__(self, name):
+        # Membership tests do not refresh recency
+        return name in self._entries
+
+    def get(self, name):
+        item = self._entries.get(name)
+        if item is None:
+            return None
+        self._entries.move_to_end(name)
+        return item[0]
+
+    def put(self, name, entry):
+        self.discard(name)
+        size = self.estimate_bytes(entry)
+        self._entries[name] = (entry, size)
+        self.current_bytes += size
+        # Evict least recently used officers, but always keep the one just added
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+        return entry
+
+    def discard(self, name):
+        item = self._entries.pop(name, None)
+        if item is not None:
+            self.current_bytes -= item[1]
+
+
+class ScaledSignatureCache:
+    """
+    LRU of resized signature images keyed by (officer name, width_px, height_px).
+    The PhotoImage for a size is created lazily, so the save path never touches Tk.
+    """
+
+    def __init__(self, max_entries=SCALED_SIGNATURE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict() # key -> {'pil_img', 'tk_img'}
+
+    def _get_entry(self, name, source_img, size):
+        key = (name, int(size[0]), int(size[1]))
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = {'pil_img': source_img.resize(key[1:], Image.LANCZOS), 'tk_img': None}
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get_image(self, name, source_img, size):
+        """Returns source_img resized to size (w, h) in pixels, resampling only on the first request."""
+        return self._get_entry(name, source_img, size)['pil_img']
+
+    def get_photo(self, name, source_img, size):
+        """Tk PhotoImage counterpart of get_image; call from the Tk thread only."""
+        entry = self._get_entry(name, source_img, size)
+        if entry['tk_img'] is None:
+            entry['tk_img'] = ImageTk.PhotoImage(entry['pil_img'])
+        return entry['tk_img']
+
+    def invalidate(self, name):
+        """Drops every size of an officer's signature, e.g. after it was reloaded from the database."""
+        for key in [key for key in self._entries if key[0] == name]:
+            del self._entries[key]
+
+
+class PageRenderCache:
+    """
+    Bounded LRU cache of rasterized pages keyed by (document, page index, quantized zoom).
+    Each entry holds the PIL image and its Tk PhotoImage; both are counted against max_bytes.
+    """
+
+    def __init__(self, max_bytes=PAGE_RENDER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict() # key -> {'pil_img', 'tk_img', 'size_bytes'}
+
+    @staticmethod
+    def make_key(doc_key, page_num, zoom, tile=None):
+        return (doc_key, page_num, quantize_zoom(zoom), tile)
+
+    @staticmethod
+    def estimate_bytes(pil_img):
+        # PIL keeps 3 bytes per RGB pixel, Tk photo images keep 4 bytes per pixel
+        return pil_img.width * pil_img.height * (3 + 4)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, pil_img, tk_img):
+        self.discard(key)
+        entry = {'pil_img': pil_img, 'tk_img': tk_img, 'size_bytes': self.estimate_bytes(pil_img)}
+        self._entries[key] = entry
+        self.current_bytes += entry['size_bytes']
+        # Evict least recently used bitmaps, but always keep the one just added
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted['size_bytes']
+        return entry
+
+    def find_best(self, doc_key, page_num):
+        """Returns (zoom, entry) for the sharpest cached full-page bitmap of a page, or (None, None)."""
+        best_zoom, best_entry = None, None
+        for (entry_doc_key, entry_page_num, zoom, tile), entry in self._entries.items():
+            if entry_doc_key == doc_key and entry_page_num == page_num and tile is None:
+                if best_zoom is None or zoom > best_zoom:
+                    best_zoom, best_entry = zoom, entry
+        return best_zoom, best_entry
+
+    def discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry['size_bytes']
+
+    def rekey_document(self, old_doc_key, new_doc_key, drop_pages=()):
+        """
+        Moves old_doc_key's bitmaps over to new_doc_key (e.g. the same report after a save),
+        keeping their LRU order; bitmaps of drop_pages, whose content changed, are dropped.
+        """
+        entries = OrderedDict()
+        for key, entry in self._entries.items():
+            if key[0] == old_doc_key:
+                if key[1] in drop_pages:
+                    self.current_bytes -= entry['size_bytes']
+                    continue
+                key = (new_doc_key,) + key[1:]
+            entries[key] = entry
+        self._entries = entries
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+
+def signature_png_bytes(sig_info):
+    """Encoded PNG for a placed signature: its ingested bytes, or a fresh encode of the PIL image."""
+    if sig_info.get('image_bytes'):
+        return sig_info['image_bytes']
+    buffer = io.BytesIO()
+    sig_info['pil_img'].save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def signature_page_rect(page, sig_info):
+    """
+    Page rectangle (PyMuPDF, top-left origin) for a placed signature.
+    'position' is the bottom-left corner measured like the viewer shows the page (page.rect),
+    so the box is flipped to a top-left origin and mapped back onto the unrotated page.
+    """
+    pos_x, pos_y = sig_info['position']
+    page_height = page.rect.height
+    rect = fitz.Rect(
+        pos_x, page_height - pos_y - sig_info['target_height_pt'],
+        pos_x + sig_info['target_width_pt'], page_height - pos_y
+    )
+    return rect * page.derotation_matrix
+
+
+# Custom document-info key in which saved reports record who signed them (read by the report catalog)
+SIGNED_BY_INFO_KEY = "HSEPortalSignedBy"
+
+
+def _info_xref(doc, create=False):
+    kind, value = doc.xref_get_key(-1, "Info")
+    if kind == "xref":
+        return int(value.split()[0])
+    if not create:
+        return None
+    xref = doc.get_new_xref()
+    doc.update_object(xref, "<<>>")
+    doc.xref_set_key(-1, "Info", f"{xref} 0 R")
+    return xref
+
+
+def read_signers(doc):
+    """Officer names recorded by mark_signed, in signing order ([] for reports not signed here)."""
+    xref = _info_xref(doc)
+    if xref is None:
+        return []
+    kind, value = doc.xref_get_key(xref, SIGNED_BY_INFO_KEY)
+    if kind != "string" or not value:
+        return []
+    return [name for name in value.split("; ") if name]
+
+
+def mark_signed(doc, names):
+    """Adds names to the signers recorded in doc's info dictionary."""
+    signers = list(dict.fromkeys(read_signers(doc) + list(names)))
+    doc.xref_set_key(_info_xref(doc, create=True), SIGNED_BY_INFO_KEY, fitz.get_pdf_str("; ".join(signers)))
+
+
+def stamp_signatures(doc, placed_signatures, progress=None):
+    """
+    Draws every placed signature straight onto the open fitz document (modifies doc in place).
+    Each distinct signature image is embedded once; later placements reference the same XObject.
+    progress, if given, is called as progress(pages_done, pages_total) after each page.
+    """
+    image_xrefs = {} # encoded PNG bytes -> xref of the image already embedded in doc
+    pages = [(page_num, sig_infos) for page_num, sig_infos in sorted(placed_signatures.items()) if sig_infos]
+    for pages_done, (page_num, sig_infos) in enumerate(pages, start=1):
+        page = doc.load_page(page_num)
+        for sig_info in sig_infos:
+            png_bytes = signature_png_bytes(sig_info)
+            xref = page.insert_image(
+                signature_page_rect(page, sig_info),
+                stream=None if png_bytes in image_xrefs else png_bytes,
+                xref=image_xrefs.get(png_bytes, 0),
+                keep_proportion=False,
+                rotate=page.rotation # Keep the signature upright as the page is displayed
+            )
+            image_xrefs.setdefault(png_bytes, xref)
+        if progress:
+            progress(pages_done, len(pages))
+    mark_signed(doc, [sig_info['name'] for _, sig_infos in pages for sig_info in sig_infos])
+
+
+def save_signed_document(doc, placed_signatures, save_path, progress=None):
+    """
+    Stamps the signatures onto doc and writes it to save_path in a single pass.
+    The document goes to a temp file next to save_path and is then moved into place, so
+    overwriting the file doc was opened from is safe. doc is closed afterwards.
+    """
+    save_path = Path(save_path)
+    tmp_path = save_path.with_name(f"{save_path.name}.{os.getpid()}.tmp")
+    try:
+        stamp_signatures(doc, placed_signatures, progress)
+        doc.save(str(tmp_path), garbage=1, deflate=True)
+        doc.close() # Release the source file before it may be replaced
+        os.replace(tmp_path, save_path)
+    finally:
+        if not doc.is_closed:
+            doc.close()
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def append_signatures_in_place(doc, placed_signatures, progress=None):
+    """
+    Stamps the signatures and appends them to the file doc was opened from as an incremental
+    update; the original bytes are left untouched. doc is closed afterwards.
+    """
+    try:
+        if not doc.can_save_incrementally():
+            raise ValueError(f"'{doc.name}' cannot take an incremental update (the file needed repair)")
+        stamp_signatures(doc, placed_signatures, progress)
+        doc.save(doc.name, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP, deflate=True)
+    finally:
+        doc.close()
+
+
+def append_signatures_to_copy(doc, placed_signatures, save_path, progress=None):
+    """
+    Copies the file doc was opened from to save_path byte for byte, then appends the signatures
+    to the copy as an incremental update. doc is closed; the copy is built in a temp file first.
+    """
+    save_path = Path(save_path)
+    tmp_path = save_path.with_name(f"{save_path.name}.{os.getpid()}.tmp")
+    source_path = doc.name
+    doc.close()
+    try:
+        shutil.copyfile(source_path, tmp_path)
+        append_signatures_in_place(fitz.open(tmp_path), placed_signatures, progress)
+        os.replace(tmp_path, save_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+# Save modes offered in the UI. Incremental modes only append the new objects to the original bytes,
+# which avoids rewriting large scanned reports; "Full rewrite" produces a compact, re-serialized file.
+SAVE_MODE_FULL = "Full rewrite"
+SAVE_MODE_APPEND_COPY = "Append to a copy"
+SAVE_MODE_APPEND_IN_PLACE = "Append in place"
+SAVE_MODES = [SAVE_MODE_FULL, SAVE_MODE_APPEND_COPY, SAVE_MODE_APPEND_IN_PLACE]
+
+
+def write_signed_pdf(doc, placed_signatures, save_path, mode=SAVE_MODE_FULL, progress=None):
+    """
+    Saves doc with placed_signatures to save_path using one of SAVE_MODES and closes doc.
+    Incremental modes fall back to a full rewrite when the file cannot take an incremental update.
+    Returns the mode that was actually used.
+    """
+    if mode != SAVE_MODE_FULL and not doc.can_save_incrementally():
+        mode = SAVE_MODE_FULL
+    if mode == SAVE_MODE_APPEND_IN_PLACE:
+        append_signatures_in_place(doc, placed_signatures, progress)
+    elif mode == SAVE_MODE_APPEND_COPY:
+        append_signatures_to_copy(doc, placed_signatures, save_path, progress)
+    else:
+        save_signed_document(doc, placed_signatures, save_path, progress)
+    return mode
+
+
+# Page progress of the save running in this (save worker) process; set by _init_save_worker
+_save_progress_queue = None
+
+
+def _init_save_worker(progress_queue):
+    global _save_progress_queue
+    _save_progress_queue = progress_queue
+
+
+def _report_save_progress(pages_done, pages_total):
+    if _save_progress_queue is not None:
+        _save_progress_queue.put((pages_done, pages_total))
+
+
+def run_save_job(source_path, placed_signatures, save_path, mode):
+    """
+    Save worker entry point: opens source_path itself (the viewer's document is never touched)
+    and writes the signed PDF with write_signed_pdf. placed_signatures must be picklable, i.e.
+    carry 'image_bytes' rather than PIL/Tk images. Returns the save mode actually used.
+    """
+    return write_signed_pdf(fitz.open(source_path), placed_signatures, save_path, mode, _report_save_progress)
+
+
+def page_layout_fingerprint(page):
+    """
+    Cheap template fingerprint of a page: size, rotation, font names and image sizes. These
+    come from the page resources without interpreting its content, and reports generated from
+    the same template share them while their text (dates, figures) differs. Pages of different
+    layouts can share a fingerprint too, so cached slots are checked with signature_slots_match().
+    """
+    fonts = sorted(font[3] for font in page.get_fonts())
+    images = sorted((image[2], image[3]) for image in page.get_images())
+    parts = [round(page.rect.width), round(page.rect.height), page.rotation, fonts, images]
+    return hashlib.sha1(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def _label_slots(page, label, roles, width_pt=SIG_TARGET_WIDTH_PT, textpage=None):
+    """{role: (x, y)} for the occurrences of one role label on the page (see detect_signature_slots)."""
+    slots = {}
+    hits = [rect * page.rotation_matrix for rect in page.search_for(label, textpage=textpage)]
+    hits = sorted(hits, key=lambda rect: rect.y1)[-len(roles):]
+    for role, rect in zip(roles, sorted(hits, key=lambda rect: rect.x0)):
+        x = (rect.x0 + rect.x1) / 2 - width_pt / 2
+        slots[role] = (round(x, 1), round(page.rect.height - (rect.y1 + SIGNATURE_SLOT_DROP_PT), 1))
+    return slots
+
+
+def detect_signature_slots(page, width_pt=SIG_TARGET_WIDTH_PT):
+    """
+    Finds the role labels of SIGNATURE_SLOT_LABELS on the page and returns {role: (x, y)}, the
+    bottom-left corner (PDF points, as displayed) of a width_pt wide signature for each one found.
+    Repeated labels ("Checked by") are assigned to their roles from left to right; when a label
+    occurs more often than it has roles, the occurrences lowest on the page are used.
+    """
+    textpage = page.get_textpage() # Extracted once and shared by all label searches
+    slots = {}
+    for label, roles in SIGNATURE_SLOT_LABELS:
+        slots.update(_label_slots(page, label, roles, width_pt, textpage))
+    return slots
+
+
+def signature_slots_match(page, slots, width_pt=SIG_TARGET_WIDTH_PT):
+    """
+    Whether cached slots fit the page: the lowest label of the layout (normally "Approved by")
+    is searched and must give exactly the cached positions. The signature block moves as a
+    unit, so one label search stands in for a full detect_signature_slots().
+    """
+    for label, roles in reversed(SIGNATURE_SLOT_LABELS):
+        cached = {role: slots[role] for role in roles if role in slots}
+        if cached:
+            return _label_slots(page, label, roles, width_pt) == cached
+    return False
+
+
+class SignatureSlotCache:
+    """
+    Detected signature slots per page-layout fingerprint, persisted as JSON under CACHE_DIR. A
+    fingerprint keeps up to SIGNATURE_SLOT_LAYOUTS_PER_FINGERPRINT layouts, most recent first;
+    a cached layout is only used once signature_slots_match() confirms it, so later reports of
+    a template cost one label search instead of a full detection. Pages without labels are
+    never cached, so they cannot shadow the signature page of the same template.
+    """
+
+    def __init__(self, path=SIGNATURE_SLOT_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self._layouts = self._read()
+
+    def _read(self):
+        try:
+            layouts = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {fingerprint: entries for fingerprint, entries in layouts.items() if isinstance(entries, list)}
+
+    def slots_for(self, page):
+        """Returns ({role: (x, y)}, source) with source 'cache' or 'detected'."""
+        fingerprint = page_layout_fingerprint(page)
+        with self.lock:
+            candidates = list(self._layouts.get(fingerprint, []))
+        for layout in candidates:
+            slots = {role: tuple(position) for role, position in layout.items()}
+            if signature_slots_match(page, slots):
+                return slots, "cache"
+        slots = detect_signature_slots(page)
+        if not slots:
+            return slots, "detected"
+        layout = {role: list(position) for role, position in slots.items()}
+        with self.lock:
+            # Merge with what other processes may have stored meanwhile
+            self._layouts = {**self._read(), **self._layouts}
+            others = [entry for entry in self._layouts.get(fingerprint, []) if entry != layout]
+            self._layouts[fingerprint] = [layout] + others[:SIGNATURE_SLOT_LAYOUTS_PER_FINGERPRINT - 1]
+            try:
+                _write_file_atomic(self.path, json.dumps(self._layouts).encode("utf-8"))
+            except OSError:
+                pass
+        return slots, "detected"
+
+
+class SigningSession(DocumentSession):
+    """
+    Headless signing engine: one open PDF at a time (see DocumentSession), signature placements in PDF points
+    (bottom-left origin, see place()) and the output writers. No Tk needed.
+    Decoded e-signs are kept in self.signatures (a SignatureCache) and reused for every document
+    the session opens. HSEReportPortalApp is a thin client over one of these; batch and watch
+    workers keep one per process.
+    """
+
+    def __init__(self, signatures=None, repository=None, disk_cache=None, slot_cache=None):
+        super().__init__()
+        self.signatures = SignatureCache() if signatures is None else signatures
+        self.slot_cache = SignatureSlotCache() if slot_cache is None else slot_cache
+        self.repository = repository # OfficerRepository / SignatureDiskCache, created on first load_signatures()
+        self.disk_cache = disk_cache
+        self.placements = {} # {page_num: [placement, ...]}
+
+    def close(self):
+        """Closes the document; its placements are dropped, so open() starts the next one clean."""
+        super().close()
+        self.placements = {}
+
+    def add_signature(self, name, image_bytes, pil_img=None):
+        """Caches an ingested e-sign; unchanged bytes are not decoded again."""
+        entry = self.signatures.get(name) if name in self.signatures else None
+        if entry is not None and entry['image_bytes'] == image_bytes:
+            return entry
+        if pil_img is None:
+            pil_img = decode_signature_image(image_bytes)
+        return self.signatures.put(name, {'pil_img': pil_img, 'tk_img': None, 'name': name, 'image_bytes': image_bytes})
+
+    def load_signatures(self, names, revalidate=False):
+        """
+        Loads e-signs for names through load_signatures (database + disk cache). Names already
+        held are skipped unless revalidate is set. Returns the error messages.
+        """
+        names = [name for name in dict.fromkeys(names) if revalidate or name not in self.signatures]
+        if not names:
+            return []
+        if self.repository is None:
+            self.repository = OfficerRepository()
+        if self.disk_cache is None:
+            self.disk_cache = SignatureDiskCache()
+        loaded, errors = load_signatures(self.repository, self.disk_cache, names)
+        for name, (image_bytes, pil_img) in loaded.items():
+            self.add_signature(name, image_bytes, pil_img)
+        return errors
+
+    @staticmethod
+    def signature_size_pt(pil_img, width_pt=SIG_TARGET_WIDTH_PT):
+        """Placement size (width, height) in points for an e-sign drawn width_pt wide."""
+        return width_pt, width_pt * pil_img.height / pil_img.width
+
+    def bottom_left_position(self, page_num, x, y_from_top, height_pt):
+        """Converts the top-left corner of a box measured from the page top into a placement position."""
+        return x, self.page_height(page_num) - (y_from_top + height_pt)
+
+    def view_rect(self, placement, page_height, zoom=1.0):
+        """(x0, y0, x1, y1) of a placement on the page as displayed (top-left origin), scaled by zoom."""
+        pos_x, pos_y = placement['position']
+        top = page_height - (pos_y + placement['target_height_pt'])
+        return (
+            pos_x * zoom, top * zoom,
+            (pos_x + placement['target_width_pt']) * zoom, (top + placement['target_height_pt']) * zoom
+        )
+
+    def place(self, page_num, name, position, signature=None):
+        """Places name's e-sign (signature entry, or looked up in self.signatures) with its bottom-left corner at position."""
+        if signature is None:
+            signature = self.signatures.get(name)
+            if signature is None:
+                raise KeyError(f"No signature image found for '{name}'")
+        width_pt, height_pt = self.signature_size_pt(signature['pil_img'])
+        placement = {
+            'pil_img': signature['pil_img'],
+            'image_bytes': signature['image_bytes'],
+            'position': position,
+            'target_width_pt': width_pt,
+            'target_height_pt': height_pt,
+            'name': name
+        }
+        self.placements.setdefault(page_num, []).append(placement)
+        return placement
+
+    def signature_slots(self, page_num):
+        """
+        ({role: (x, y)}, source) for a page: slots detected from its role labels ('detected', or
+        'cache' for a known template), or ESIGN_COORDINATES ('default') if it has no labels.
+        """
+        slots, source = self.slot_cache.slots_for(self.page(page_num))
+        if not slots:
+            return dict(ESIGN_COORDINATES), "default"
+        return slots, source
+
+    def place_roles(self, page_num, assignments):
+        """
+        Replaces the page's placements with each {role: officer name} e-sign in its slot
+        (see signature_slots). Returns (new placements, error messages, slot source).
+        """
+        self.placements[page_num] = []
+        slots, slot_source = self.signature_slots(page_num)
+        placed, errors = [], []
+        for role_title, name in assignments.items():
+            if role_title not in slots:
+                errors.append(f"No signature slot found for role: '{role_title}'. Skipping '{name}'.")
+                continue
+            signature = self.signatures.get(name)
+            if signature is None:
+                errors.append(f"No signature image found for '{name}'. Skipping placement.")
+                continue
+            placed.append(self.place(page_num, name, slots[role_title], signature))
+        return placed, errors, slot_source
+
+    def remove(self, page_num, placement):
+        page_placements = self.placements.get(page_num, [])
+        if placement in page_placements:
+            page_placements.remove(placement)
+
+    def has_placements(self):
+        return any(self.placements.values())
+
+    def portable_placements(self):
+        """Placements as plain picklable data (no PIL/Tk images), e.g. for run_save_job in a worker process."""
+        return {
+            page_num: [
+                {
+                    'image_bytes': signature_png_bytes(placement),
+                    'position': placement['position'],
+                    'target_width_pt': placement['target_width_pt'],
+                    'target_height_pt': placement['target_height_pt'],
+                    'name': placement['name']
+                }
+                for placement in page_placements
+            ]
+            for page_num, page_placements in self.placements.items() if page_placements
+        }
+
+    def save(self, save_path, mode=SAVE_MODE_FULL, progress=None):
+        """
+        Writes the document with its placements to save_path (see write_signed_pdf) and returns the
+        save mode used. The file is re-read for this, so the open document stays unmodified.
+        """
+        return write_signed_pdf(fitz.open(self.path), self.placements, save_path, mode, progress)
+
+
+# DD.MM.YYYY with '.', '-', '/' or ' ' separators (as in "02.05-2025"), or DDMMYYYY run together
+REPORT_DATE_RE = re.compile(r"(?<!\d)(?:(\d{1,2})[./\- ]{1,2}(\d{1,2})[./\- ]{1,2}(\d{4})|(\d{2})(\d{2})(\d{4}))(?!\d)")
+REPORT_DATE_LABEL_RE = re.compile(r"report\s*(?:date|for|dated)\s*:?\s*", re.I)
+
+
+def find_report_date(text):
+    """First valid day-month-year date in text, as a datetime.date, or None."""
+    for match in REPORT_DATE_RE.finditer(text or ""):
+        day, month, year = [g for g in match.groups() if g is not None]
+        try:
+            return datetime(int(year), int(month), int(day)).date()
+        except ValueError:
+            continue
+    return None
+
+
+def report_date_from_filename(path):
+    """Date in a report file name, e.g. HSE_DailyReport03112004.pdf or hse_report_02-05-2025.pdf."""
+    return find_report_date(Path(path).stem.replace("_", " "))
+
+
+def extract_report_date(doc, path):
+    """
+    Report date from, in order, the file name, the document title/subject/keywords and the
+    first page's text (preferring a date after a "Report date:"/"Report for" label).
+    Returns (datetime.date, source) or (None, None).
+    """
+    found = report_date_from_filename(path)
+    if found:
+        return found, "filename"
+    metadata = doc.metadata or {}
+    found = find_report_date(" ".join(metadata.get(key) or "" for key in ("title", "subject", "keywords")))
+    if found:
+        return found, "metadata"
+    if doc.page_count:
+        text = doc.load_page(0).get_text()
+        label = REPORT_DATE_LABEL_RE.search(text)
+        found = (label and find_report_date(text[label.end():label.end() + 40])) or find_report_date(text)
+        if found:
+            return found, "text"
+    return None, None
+
+
+def extract_report_info(path):
+    """Catalog worker: date, title, page count and signing status of one report. Never raises."""
+    info = {'path': str(path), 'report_date': None, 'date_source': None, 'title': None, 'pages': None,
+            'status': "unreadable", 'officers': []}
+    try:
+        with fitz.open(path) as doc:
+            report_date, info['date_source'] = extract_report_date(doc, path)
+            info['report_date'] = report_date.isoformat() if report_date else None
+            info['title'] = (doc.metadata or {}).get('title') or None
+            info['pages'] = doc.page_count
+            info['officers'] = read_signers(doc)
+            info['status'] = "signed" if info['officers'] else "unsigned"
+    except Exception:
+        pass
+    return info
+
+
+class ReportCatalog:
+    """
+    SQLite index of report PDFs (date, title, pages, signing status, signing officers) keyed by
+    path and revalidated by mtime and size, so update() only re-reads new or changed files.
+    Safe to share between threads; every statement runs under one lock.
+    """
+
+    def __init__(self, db_path=REPORT_CATALOG_PATH):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS reports (
+                    path TEXT PRIMARY KEY, folder TEXT, mtime_ns INTEGER, size INTEGER,
+                    report_date TEXT, date_source TEXT, title TEXT, pages INTEGER, status TEXT
+                );
+                CREATE INDEX IF NOT EXISTS reports_date ON reports (report_date);
+                CREATE INDEX IF NOT EXISTS reports_status ON reports (status);
+                CREATE INDEX IF NOT EXISTS reports_folder ON reports (folder);
+                CREATE TABLE IF NOT EXISTS report_officers (path TEXT, officer TEXT);
+                CREATE INDEX IF NOT EXISTS report_officers_officer ON report_officers (officer COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS report_officers_path ON report_officers (path);
+            """)
+
+    @staticmethod
+    def _scan_roots(folders, shallow_folders=()):
+        """
+        [(root, recursive), ...] with nested roots folded into their parent: a folder inside a
+        recursive root adds nothing, and each shallow folder is listed once.
+        """
+        recursive = sorted({Path(folder).resolve() for folder in folders}, key=lambda p: len(p.parts))
+        roots = []
+        for folder in recursive:
+            if not any(root == folder or root in folder.parents for root, _ in roots):
+                roots.append((folder, True))
+        for folder in sorted({Path(folder).resolve() for folder in shallow_folders}):
+            if not any(root == folder or root in folder.parents for root, _ in roots):
+                roots.append((folder, False))
+        return roots
+
+    def update(self, folders, workers=None, progress=None, shallow_folders=()):
+        """
+        Brings the index up to date with every PDF under folders (recursively) and directly inside
+        shallow_folders: new or changed files are read in a process pool, deleted ones dropped.
+        progress(done, total) is called as files are read. Returns {'indexed': n, 'removed': n, 'unchanged': n}.
+        """
+        roots = self._scan_roots(folders, shallow_folders)
+        on_disk = {}
+        for root, recursive in roots:
+            for path in (root.rglob("*") if recursive else root.glob("*")):
+                if path.suffix.lower() != ".pdf":
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                on_disk.setdefault(str(path.resolve()), (str(root), stat.st_mtime_ns, stat.st_size))
+
+        with self.lock:
+            # Rows of the scanned roots (for deletions) plus rows of any file found, whichever root stored it
+            known = {}
+            for root, recursive in roots:
+                # A recursive root also owns rows stored earlier under one of its subfolders
+                prefix = os.path.join(str(root), "") if recursive else None
+                for path, mtime_ns, size in self.conn.execute(
+                    "SELECT path, mtime_ns, size FROM reports WHERE folder = ? OR substr(folder, 1, length(?)) = ?",
+                    (str(root), prefix, prefix)
+                ):
+                    known[path] = (mtime_ns, size)
+            for path in on_disk.keys() - known.keys():
+                row = self.conn.execute("SELECT mtime_ns, size FROM reports WHERE path = ?", (path,)).fetchone()
+                if row is not None:
+                    known[path] = row
+        changed = [path for path, (_, mtime_ns, size) in on_disk.items() if known.get(path) != (mtime_ns, size)]
+        removed = [path for path in known if path not in on_disk]
+
+        infos = []
+        if changed:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                for info in pool.map(extract_report_info, changed, chunksize=16):
+                    infos.append(info)
+                    if progress:
+                        progress(len(infos), len(changed))
+
+        with self.lock, self.conn:
+            for path in removed:
+                self.conn.execute("DELETE FROM reports WHERE path = ?", (path,))
+                self.conn.execute("DELETE FROM report_officers WHERE path = ?", (path,))
+            for info in infos:
+                folder, mtime_ns, size = on_disk[info['path']]
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (info['path'], folder, mtime_ns, size, info['report_date'], info['date_source'],
+                     info['title'], info['pages'], info['status'])
+                )
+                self.conn.execute("DELETE FROM report_officers WHERE path = ?", (info['path'],))
+                self.conn.executemany(
+                    "INSERT INTO report_officers VALUES (?, ?)", [(info['path'], name) for name in info['officers']]
+                )
+        return {'indexed': len(infos), 'removed': len(removed), 'unchanged': len(on_disk) - len(changed)}
+
+    def search(self, date_from=None, date_to=None, officer=None, status=None, text=None, limit=500):
+        """
+        Reports matching every given filter, newest first. Dates are datetime.date or ISO strings;
+        officer and text match case-insensitively anywhere in the officer name / path and title.
+        """
+        clauses, params = [], []
+        if date_from:
+            clauses.append("report_date >= ?")
+            params.append(str(date_from))
+        if date_to:
+            clauses.append("report_date <= ?")
+            params.append(str(date_to))
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if officer:
+            clauses.append("path IN (SELECT path FROM report_officers WHERE officer LIKE ?)")
+            params.append(f"%{officer}%")
+        if text:
+            clauses.append("(path LIKE ? OR title LIKE ?)")
+            params.extend([f"%{text}%"] * 2)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT path, report_date, date_source, title, pages, status FROM reports {where} "
+                "ORDER BY report_date IS NULL, report_date DESC, path LIMIT ?",
+                params + [limit]
+            ).fetchall()
+            results = []
+            for path, report_date, date_source, title, pages, status in rows:
+                officers = [name for (name,) in self.conn.execute(
+                    "SELECT officer FROM report_officers WHERE path = ?", (path,)
+                )]
+                results.append({
+                    'path': path, 'report_date': report_date, 'date_source': date_source, 'title': title,
+                    'pages': pages, 'status': status, 'officers': officers
+                })
+        return results
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def save_signed_document_legacy(doc, placed_signatures, save_path):
+    """
+    Former PyPDF2 + ReportLab save path, kept only as the --benchmark-save baseline.
+    Serializes doc, re-parses it and merges a one-off ReportLab PDF per signature.
+    """
+    from PyPDF2 import PdfFileReader, PdfFileWriter
+    from reportlab.pdfgen import canvas as rp_canvas
+    from reportlab.lib.utils import ImageReader
+
+    reader = PdfFileReader(io.BytesIO(doc.tobytes()))
+    writer = PdfFileWriter()
+
+    for i in range(reader.getNumPages()):
+        page = reader.getPage(i)
+        for sig_info in placed_signatures.get(i, []):
+            pos_x, pos_y = sig_info['position']
+            target_width_pt = sig_info['target_width_pt']
+            target_height_pt = sig_info['target_height_pt']
+
+            packet = io.BytesIO()
+            c = rp_canvas.Canvas(packet, pagesize=(target_width_pt, target_height_pt))
+            c.drawImage(
+                ImageReader(sig_info['pil_img']),
+                0, 0, width=target_width_pt, height=target_height_pt, mask='auto'
+            )
+            c.save()
+            packet.seek(0)
+            page.mergeTransformedPage(PdfFileReader(packet).getPage(0), (1, 0, 0, 1, pos_x, pos_y))
+        writer.addPage(page)
+
+    with open(save_path, "wb") as output_file:
+        writer.write(output_file)
+    doc.close()
+
+
+# Bottom-left slot positions (PDF points) stamped on every page by --benchmark-save
+BENCHMARK_SIGNATURE_POSITIONS = [(70, 100), (250, 100), (430, 100), (70, 40), (250, 40)]
+
+
+def _benchmark_signature():
+    """Synthetic scanned signature run through ingest_signature, so no database is needed."""
+    from PIL import ImageDraw
+    scan = Image.new("RGB", (1200, 480), "white")
+    draw = ImageDraw.Draw(scan)
+    draw.line([(150, 330), (380, 140), (520, 360), (760, 170), (1020, 300)], fill=(20, 30, 120), width=9)
+    buffer = io.BytesIO()
+    scan.save(buffer, format="JPEG", quality=90)
+    return ingest_signature(buffer.getvalue())
+
+
+def benchmark_save(pdf_paths, repeats=5):
+    """
+    Times save_signed_document and append_signatures_to_copy against the legacy PyPDF2 + ReportLab path on each PDF, with
+    BENCHMARK_SIGNATURE_POSITIONS stamped on every page. Prints best-of-repeats times and output sizes.
+    """
+    import tempfile
+
+    encoded_bytes, pil_img = _benchmark_signature()
+    engines = [
+        ("pymupdf", save_signed_document),
+        ("pymupdf-append", append_signatures_to_copy),
+        ("pypdf2+reportlab", save_signed_document_legacy)
+    ]
+    print(f"{'file':<36} {'pages':>5} {'engine':<18} {'best ms':>9} {'size KB':>9}")
+    with tempfile.TemporaryDirectory() as out_dir:
+        for pdf_path in pdf_paths:
+            pdf_path = Path(pdf_path)
+            with fitz.open(pdf_path) as probe:
+                page_count = len(probe)
+            placed_signatures = {
+                page_num: [
+                    {
+                        'pil_img': pil_img, 'image_bytes': encoded_bytes, 'name': f"Officer {slot}",
+                        'position': position, 'target_width_pt': SIG_TARGET_WIDTH_PT,
+                        'target_height_pt': SIG_TARGET_WIDTH_PT * pil_img.height / pil_img.width
+                    }
+                    for slot, position in enumerate(BENCHMARK_SIGNATURE_POSITIONS)
+                ]
+                for page_num in range(page_count)
+            }
+            for engine_name, save_fn in engines:
+                out_path = Path(out_dir) / f"{engine_name}_{pdf_path.name}"
+                timings = []
+                try:
+                    for _ in range(repeats):
+                        doc = fitz.open(pdf_path)
+                        start = time.perf_counter()
+                        save_fn(doc, placed_signatures, out_path)
+                        timings.append(time.perf_counter() - start)
+                except ImportError as e:
+                    print(f"{pdf_path.name:<36} {page_count:>5} {engine_name:<18} skipped ({e})")
+                    continue
+                size_kb = out_path.stat().st_size / 1024
+                print(f"{pdf_path.name:<36} {page_count:>5} {engine_name:<18} {min(timings) * 1000:>9.1f} {size_kb:>9.1f}")
+
+
+# Signing session of a batch/watch worker process, reused for every report that process signs
+_worker_signing_session = None
+
+
+def sign_report_file(pdf_path, output_path, assignments, signature_bytes, page_index=0, save_mode=SAVE_MODE_FULL):
+    """
+    Batch worker: places the {role: officer name} e-signs (signature_bytes maps names to ingested PNG
+    bytes) on one page of pdf_path and writes output_path. Negative page_index counts from the end.
+    Signatures are decoded once per worker process, not per report.
+    Never raises; returns a result dict for the batch summary.
+    """
+    global _worker_signing_session
+    if _worker_signing_session is None:
+        _worker_signing_session = SigningSession()
+    session = _worker_signing_session
+    start = time.perf_counter()
+    result = {
+        'file': str(pdf_path), 'output': str(output_path), 'pages': None, 'slots': None, 'status': "ok", 'error': None
+    }
+    try:
+        for name, image_bytes in signature_bytes.items():
+            session.add_signature(name, image_bytes)
+        doc = session.open(pdf_path)
+        result['pages'] = len(doc)
+        if not -len(doc) <= page_index < len(doc):
+            raise ValueError(f"page {page_index + 1 if page_index >= 0 else page_index} does not exist")
+        _, errors, result['slots'] = session.place_roles(page_index % len(doc), assignments)
+        if errors:
+            raise ValueError(" ".join(errors))
+        session.save(output_path, save_mode)
+    except Exception as e:
+        result['status'] = "failed"
+        result['error'] = str(e)
+    finally:
+        session.close()
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def check_signature_roles(assignments):
+    """Raises ValueError naming the roles of a {role: officer name} mapping that are not in SIGNATURE_ROLES."""
+    unknown_roles = [role for role in assignments if role not in SIGNATURE_ROLES]
+    if unknown_roles:
+        raise ValueError(f"Unknown signature role(s): {', '.join(unknown_roles)}. Roles: {', '.join(SIGNATURE_ROLES)}")
+
+
+def batch_sign(input_dir, output_dir, assignments, workers=None, page_index=0, save_mode=SAVE_MODE_FULL):
+    """
+    Signs every PDF in input_dir without Tk: e-signs for the {role: officer name} assignments are
+    resolved once (database, falling back to the local signature cache), then the files are
+    stamped across a process pool into output_dir. Returns (results, wall_seconds).
+    """
+    check_signature_roles(assignments)
+    input_dir, output_dir = Path(input_dir), Path(output_dir)
+    if input_dir.resolve() == output_dir.resolve():
+        raise ValueError("The output directory must differ from the input directory")
+
+    session = SigningSession()
+    for error in session.load_signatures(assignments.values()):
+        print(error)
+    missing = sorted({name for name in assignments.values() if name not in session.signatures})
+    if missing:
+        raise ValueError(f"No signature image found for: {', '.join(missing)}")
+    # Workers get the compact encoded e-signs and decode them once per process
+    signature_bytes = {name: session.signatures.get(name)['image_bytes'] for name in set(assignments.values())}
+    pdf_paths = sorted(path for path in input_dir.iterdir() if path.suffix.lower() == ".pdf" and path.is_file())
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [
+            pool.submit(
+                sign_report_file, pdf_path, output_dir / pdf_path.name, assignments, signature_bytes, page_index, save_mode
+            )
+            for pdf_path in pdf_paths
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{len(results)}/{len(futures)}] {result['status']:<6} {Path(result['file']).name}")
+    return sorted(results, key=lambda r: r['file']), time.perf_counter() - start
+
+
+def print_batch_summary(results, wall_seconds):
+    """Prints per-file timings and failures for a batch_sign run."""
+    print(f"\n{'file':<40} {'pages':>5} {'slots':<8} {'seconds':>8}  status")
+    for result in results:
+        print(f"{Path(result['file']).name:<40} {result['pages'] or '-':>5} {result['slots'] or '-':<8} {result['seconds']:>8.2f}  "
+              f"{result['status']}{': ' + result['error'] if result['error'] else ''}")
+    failed = [r for r in results if r['status'] != "ok"]
+    busy_seconds = sum(r['seconds'] for r in results)
+    print(f"\n{len(results) - len(failed)} signed, {len(failed)} failed in {wall_seconds:.2f} s wall clock "
+          f"({busy_seconds:.2f} s of worker time, {len(results) / wall_seconds if wall_seconds else 0:.1f} files/s)")
+
+
+class WatchFolderDaemon:
+    """
+    Long-running signer for a scanner drop folder. The inbox is polled for files matching pattern;
+    a file is claimed once its size and mtime are unchanged between two polls (so half-written
+    scans are left alone) and goes through a bounded queue to worker threads, each driving
+    sign_report_file in a shared process pool. When the queue is full the scan stops early and the
+    remaining files are picked up on a later poll (backpressure).
+    Signed reports are written to outbox and the originals moved to archive_dir. Failed files are
+    retried with exponential backoff and, after max_attempts, moved to quarantine_dir together with
+    a .error.txt note. Ctrl+C and SIGTERM both stop it after the reports in flight are finished.
+    """
+
+    def __init__(self, inbox, outbox, assignments, quarantine_dir=None, archive_dir=None, pattern="HSE_Report*.pdf",
+                 workers=2, queue_size=8, poll_interval_s=5.0, max_attempts=3, page_index=0,
+                 save_mode=SAVE_MODE_FULL, signature_refresh_s=600):
+        check_signature_roles(assignments)
+        self.inbox = Path(inbox)
+        self.outbox = Path(outbox)
+        self.quarantine_dir = Path(quarantine_dir) if quarantine_dir else self.inbox / "quarantine"
+        self.archive_dir = Path(archive_dir) if archive_dir else self.outbox / "originals"
+        self.assignments = assignments
+        self.pattern = pattern
+        self.workers = workers
+        self.poll_interval_s = poll_interval_s
+        self.max_attempts = max_attempts
+        self.page_index = page_index
+        self.save_mode = save_mode
+        self.signature_refresh_s = signature_refresh_s
+
+        self.session = SigningSession() # Holds the assigned officers' decoded e-signs
+        self.signature_bytes = None # {name: ingested PNG bytes} handed to sign_report_file
+        self.signatures_loaded_at = None
+
+        self.work_queue = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.claimed = set() # Paths queued or being signed
+        self.last_seen = {} # path -> (size, mtime_ns) from the previous poll
+        self.attempts = {} # path -> failed attempts so far
+        self.last_errors = {} # path -> error of the latest failed attempt
+        self.retry_after = {} # path -> time.monotonic() before which a failed file is not retried
+        self.pool = None
+
+    def log(self, msg):
+        print(f"{datetime.now():%Y-%m-%d %H:%M:%S} {msg}", flush=True)
+
+    def refresh_signatures(self):
+        """
+        (Re)loads the assigned officers' e-signs; cached files are only revalidated by hash.
+        Signatures that cannot be reloaded keep their previously loaded version.
+        """
+        for error in self.session.load_signatures(self.assignments.values(), revalidate=self.signature_bytes is not None):
+            self.log(error)
+        missing = sorted({name for name in self.assignments.values() if name not in self.session.signatures})
+        if missing:
+            raise ValueError(f"No signature image found for: {', '.join(missing)}")
+        self.signature_bytes = {
+            name: self.session.signatures.get(name)['image_bytes'] for name in set(self.assignments.values())
+        }
+        self.signatures_loaded_at = time.monotonic()
+
+    def run(self):
+        """Polls the inbox until stop() is called or the process is interrupted."""
+        for directory in (self.inbox, self.outbox, self.quarantine_dir, self.archive_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        self.refresh_signatures()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        threads = [
+            threading.Thread(target=self._worker_loop, name=f"sign-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        self.log(f"Watching {self.inbox} for {self.pattern} ({self.workers} worker(s), queue of {self.work_queue.maxsize})")
+        previous_sigterm = None
+        if threading.current_thread() is threading.main_thread():
+            # A service manager stops the daemon with SIGTERM: finish the reports in flight, then exit
+            previous_sigterm = signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        try:
+            while not self.stop_event.is_set():
+                if time.monotonic() - self.signatures_loaded_at > self.signature_refresh_s:
+                    self.refresh_signatures()
+                self.scan_inbox()
+                self.stop_event.wait(self.poll_interval_s)
+        except KeyboardInterrupt:
+            self.log("Stopping...")
+        finally:
+            self.stop_event.set()
+            for thread in threads:
+                thread.join()
+            self.pool.shutdown(wait=True)
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
+            self.log("Stopped")
+
+    def stop(self):
+        self.stop_event.set()
+
+    def scan_inbox(self):
+        now = time.monotonic()
+        current = {}
+        for path in sorted(self.inbox.glob(self.pattern)):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            current[path] = (stat.st_size, stat.st_mtime_ns)
+        previous, self.last_seen = self.last_seen, current
+
+        for path, signature in current.items():
+            if previous.get(path) != signature:
+                continue # New or still being written; look again on the next poll
+            with self.lock:
+                if path in self.claimed or self.retry_after.get(path, 0) > now:
+                    continue
+                # Claimed before it is queued, so a worker finishing it early cannot leave a stale claim behind
+                self.claimed.add(path)
+            try:
+                self.work_queue.put(path, timeout=self.poll_interval_s)
+            except queue.Full:
+                with self.lock:
+                    self.claimed.discard(path)
+                self.log(f"Work queue full; {self.inbox} will be rescanned in {self.poll_interval_s:g} s")
+                return
+
+    def _worker_loop(self):
+        while not self.stop_event.is_set():
+            try:
+                path = self.work_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                self._process(path)
+            except Exception as e:
+                # Archive moves and a crashed pool must not kill the worker thread
+                self._record_failure(path, f"{type(e).__name__}: {e}")
+            finally:
+                with self.lock:
+                    self.claimed.discard(path)
+                self.work_queue.task_done()
+
+    def _sign(self, path):
+        """Runs sign_report_file in the pool, replacing the pool if a worker process died."""
+        with self.lock:
+            pool = self.pool
+        try:
+            return pool.submit(
+                sign_report_file, path, self.outbox / path.name, self.assignments, self.signature_bytes,
+                self.page_index, self.save_mode
+            ).result()
+        except BrokenProcessPool:
+            with self.lock:
+                if self.pool is pool: # Another worker thread may have replaced it already
+                    self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            pool.shutdown(wait=False)
+            raise
+
+    def _process(self, path):
+        with self.lock:
+            quarantine_pending = self.attempts.get(path, 0) >= self.max_attempts
+        if quarantine_pending:
+            self._quarantine(path) # An earlier quarantine move failed; retry just the move
+            return
+        result = self._sign(path)
+        if result['status'] != "ok":
+            self._record_failure(path, result['error'])
+            return
+        shutil.move(path, self.archive_dir / path.name)
+        with self.lock:
+            self.attempts.pop(path, None)
+            self.last_errors.pop(path, None)
+            self.retry_after.pop(path, None)
+        self.log(f"Signed {path.name} in {result['seconds']:.2f} s")
+
+    def _record_failure(self, path, error):
+        """Schedules a retry with backoff or, after max_attempts, quarantines the file with an error note."""
+        with self.lock:
+            attempts = self.attempts[path] = self.attempts.get(path, 0) + 1
+            self.last_errors[path] = error
+        if attempts < self.max_attempts:
+            delay_s = self.poll_interval_s * 2 ** attempts
+            with self.lock:
+                self.retry_after[path] = time.monotonic() + delay_s
+            self.log(f"Failed to sign {path.name} (attempt {attempts}/{self.max_attempts}, retrying in {delay_s:g} s): {error}")
+            return
+        self._quarantine(path)
+
+    def _quarantine(self, path):
+        """
+        Moves a file that used up its attempts to quarantine_dir with a .error.txt note. If the move
+        fails, its attempt count is kept so the next poll retries the move, not the signing.
+        """
+        with self.lock:
+            attempts = self.attempts.get(path, 0)
+            error = self.last_errors.get(path)
+        quarantined_path = self.quarantine_dir / path.name
+        try:
+            shutil.move(path, quarantined_path)
+        except (OSError, shutil.Error) as e:
+            with self.lock:
+                self.retry_after[path] = time.monotonic() + self.poll_interval_s * 2 ** attempts
+            self.log(f"Could not quarantine {path.name} after {attempts} failed attempt(s): {e}")
+            return
+        with self.lock:
+            self.attempts.pop(path, None)
+            self.last_errors.pop(path, None)
+            self.retry_after.pop(path, None)
+        try:
+            quarantined_path.with_name(f"{path.name}.error.txt").write_text(
+                f"{datetime.now():%Y-%m-%d %H:%M:%S} failed {attempts} time(s): {error}\n", encoding="utf-8"
+            )
+        except OSError as e:
+            self.log(f"Could not write the error note for {path.name}: {e}")
+        self.log(f"Quarantined {path.name} after {attempts} failed attempt(s): {error}")
+
+
 class HSEReportPortalApp:
     def __init__(self, root):
         self.root = root
@@ -25,6 +1969,7 @@ class HSEReportPortalApp:
         self.root.geometry("1160x760") 
         self.root.configure(bg="#E0E0E0")
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.root.grid_rowconfigure(0, weight=0)
         self.root.grid_rowconfigure(1, weight=1)
@@ -33,44 +1978,59 @@ class HSEReportPortalApp:
         ###
         # Variables
         ###
-        self.pdf_path = None
         self.pdf_img_tk = None
-        self.pdf_doc = None
+        self.page_render_cache = PageRenderCache()
+        self.render_worker = PageRenderWorker(on_result=self._on_render_worker_result)
+        self.displayed_page_key = None # (doc_key, page_num) of the bitmap currently on the canvas
+        self.displayed_view_key = None # (doc_key, page_num, zoom) the canvas items were laid out for
+        self.selected_placed_signature = None # Placed signature highlighted via right-click
+        self.displayed_tiles = {} # (col, row) -> (canvas item id, PhotoImage) while a page is shown in tiled mode
+        self.displayed_tile_placeholders = {} # (col, row) -> (canvas item id, PhotoImage) stretched stand-ins for tiles
+        self.pending_render_job = None # Last full-page job handed to the render worker
+        self.prefetch_jobs = {} # cache key -> job for neighbouring pages being rendered ahead of time
+
+        # Thumbnail sidebar state; thumbnails are generated off the Tk thread and cached on disk by file hash
+        self.thumbnail_dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thumbnails")
+        self.thumbnail_pool = None # ProcessPoolExecutor, created on first use
+        self.thumbnail_file_hashes = {} # doc_key -> sha1 of the file contents
+        self.thumbnail_images = {} # page_num -> PhotoImage shown in the sidebar
+        self.thumbnails_requested = set()
+        self.thumbnail_slot_height = 0
+        self.thumbnail_update_id = None
+        self.tile_update_id = None # after() ID of the pending visible-tile refresh
+
+        # In-document search; the word index is built on the thumbnail dispatcher when a PDF is opened
+        self.text_index = None # TextIndex of the open document, None while it is being built
+        self.search_query = "" # Query the current hits belong to
+        self.search_hits = [] # [(page_num, [word box, ...]), ...] in page order
+        self.search_hit_index = -1 # Hit shown with the strong highlight
+
+        # Saving runs in a worker process (PyMuPDF is not thread-safe) driven by a dispatcher thread
+        self.save_dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self.save_pool = None # ProcessPoolExecutor, created on first save
+        self.save_progress_queue = None # multiprocessing.Queue the save worker reports page progress on
+        self.save_in_progress = False
+        self._ui_queue = queue.Queue() # Callbacks posted by background threads, run on the Tk thread
         self.current_zoom = 1.0
         self.current_page_num = 0
         self.signature_position_pdf = None # (x,y) in PDF points (bottom-left origin) for the clicked TOP-LEFT of signature
 
-        # E-sign coordinates (X from left, Y from BOTTOM in PDF points)
-        self.esign_coordinates = {
-            "Initiated By": (81.6, 123.7),
-            "Verified By": (176.0, 121.3),
-            "Checked By 1": (272.0, 118.1),
-            "Checked By 2": (368.8, 119.7),
-            "Checked By 3": (462.4, 121.3),
-            "Reviewed By Officer 1": (105.6, 38.1),
-            "Reviewed By Officer 2": (240.8, 37.3),
-            "Approved By": (408.0, 44.5)
-        }
-
         # Stores {role_title: selected_name} for automated placement when "LOAD SIGNATURE" is clicked
         self.selected_officer_assignments = {} 
 
-        # Cache for loaded signatures: {name: {'pil_img': PIL_Image, 'tk_img': ImageTk.PhotoImage, 'image_bytes': bytes}}
-        self.loaded_signatures_cache = {}
+        # Bounded cache for loaded signatures: {name: {'pil_img': PIL_Image, 'tk_img': ImageTk.PhotoImage, 'image_bytes': bytes}}
+        self.loaded_signatures_cache = SignatureCache()
         
         # Data for the currently active signature (the one selected in dropdown for manual placement)
         self.current_active_signature_data = {
             'pil_img': None,
             'tk_img': None, # This will be the PhotoImage for the top-right preview
             'name': None,
-            'image_bytes': None # Store original bytes for apply_signature
+            'image_bytes': None # Compact encoded PNG of the signature (see ingest_signature)
         }
 
         self.temp_scaled_sig_tk = None # Temporary PhotoImage for the click-placement preview
-
-        # Stores signatures placed on the PDF canvas, pending final application on save
-        # Structure: {page_number: [{'pil_img': PIL_Image, 'position': (x,y), 'height_pt': float, 'name': str}, ...]}
-        self.placed_signatures = {}
+        self.scaled_signature_cache = ScaledSignatureCache() # Shared resized signatures per (name, pixel size)
 
         # Variables for animated logo
         self.logo_frames = []
@@ -92,6 +2052,20 @@ class HSEReportPortalApp:
             "Checked By 3", "Reviewed By Officer 1", "Reviewed By Officer 2", "Approved By"
         ]
         self.officer_dropdowns = {} # Stores references to the Combobox widgets by role title
+        self.officer_repository = OfficerRepository() # Pooled access to officer names and e-signs
+        self.signature_disk_cache = SignatureDiskCache() # Decoded e-signs persisted across launches
+        # Open document, placed signatures (PDF points) and saving; the UI only draws and forwards input.
+        # session.doc_key identifies the open PDF in the render cache.
+        self.session = SigningSession(self.loaded_signatures_cache, self.officer_repository, self.signature_disk_cache)
+        self.report_catalog = None # ReportCatalog, opened with the report finder
+        self.catalog_folders = [p.resolve() for p in REPORT_DIRS] # Indexed recursively
+        self.opened_report_folders = set() # Folders of reports opened this session, indexed without subfolders
+        self.report_finder = None # Toplevel of the report finder while it is open
+        self.db_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="db") # Background database work
+        self.signatures_in_flight = set() # Names whose e-signs are being fetched in the background
+        self.signature_batches = [] # (future, names) of background e-sign fetches not yet delivered
+        self.auto_placement_pending = False # LOAD SIGNATURE is waiting for background fetches to finish
+        self.pending_active_signature_name = None # Dropdown choice waiting for its e-sign to arrive
 
         ###
         # Build UI
@@ -100,6 +2074,7 @@ class HSEReportPortalApp:
         self.fetch_names()
         self._generate_hse_label_colors() # Generate colors once
         self._animate_hse_label() # Start the text animation
+        self._drain_ui_queue()
 
     def create_rounded_button(self, parent, text, command, bg_color, fg_color="black", font=("Inter", 10, "bold"), pady_val=8, padx_val=15):
         """Helper to create a button with common styling and hover effects."""
@@ -271,6 +2246,61 @@ class HSEReportPortalApp:
         self.frame_pdf.grid_rowconfigure(0, weight=1)
         self.frame_pdf.grid_columnconfigure(0, weight=1)
 
+        # Page navigation bar below the PDF canvas
+        page_nav_frame = Frame(self.frame_pdf, bg="#D3D3D3")
+        page_nav_frame.pack(side="bottom", fill="x", pady=(2, 2))
+        self.btn_prev_page = self.create_rounded_button(page_nav_frame, "< PREV", self.prev_page, "#A7C7E7", pady_val=1, padx_val=10)
+        self.btn_prev_page.pack(side="left", padx=5)
+        self.btn_next_page = self.create_rounded_button(page_nav_frame, "NEXT >", self.next_page, "#A7C7E7", pady_val=1, padx_val=10)
+        self.btn_next_page.pack(side="right", padx=5)
+        page_nav_center = Frame(page_nav_frame, bg="#D3D3D3")
+        page_nav_center.pack(side="top")
+        Label(page_nav_center, text="PAGE", font=("Inter", 10, "bold"), bg="#D3D3D3").pack(side="left", padx=(0, 5))
+        self.page_entry = Entry(page_nav_center, width=5, justify="center", font=("Inter", 10), bd=1, relief="solid")
+        self.page_entry.pack(side="left")
+        self.page_entry.bind("<Return>", self._on_page_entry_submit)
+        self.page_count_label = Label(page_nav_center, text="/ 0", font=("Inter", 10, "bold"), bg="#D3D3D3")
+        self.page_count_label.pack(side="left", padx=(5, 0))
+        self.root.bind("<Prior>", lambda e: self.prev_page())
+        self.root.bind("<Next>", lambda e: self.next_page())
+
+        # In-document search bar above the page navigation
+        search_frame = Frame(self.frame_pdf, bg="#D3D3D3")
+        search_frame.pack(side="bottom", fill="x", pady=(2, 0))
+        Label(search_frame, text="FIND", font=("Inter", 10, "bold"), bg="#D3D3D3").pack(side="left", padx=5)
+        self.search_entry = Entry(search_frame, font=("Inter", 10), bd=1, relief="solid")
+        self.search_entry.pack(side="left", fill="x", expand=True)
+        self.search_entry.bind("<Return>", lambda e: self.find_next())
+        self.search_entry.bind("<Shift-Return>", lambda e: self.find_previous())
+        self.search_entry.bind("<Escape>", lambda e: self.clear_search())
+        self.btn_find_prev = self.create_rounded_button(search_frame, "<", self.find_previous, "#A7C7E7", pady_val=0, padx_val=6)
+        self.btn_find_prev.pack(side="left", padx=(5, 0))
+        self.btn_find_next = self.create_rounded_button(search_frame, ">", self.find_next, "#A7C7E7", pady_val=0, padx_val=6)
+        self.btn_find_next.pack(side="left", padx=(2, 0))
+        self.search_status_label = Label(search_frame, text="", width=12, anchor="w", font=("Inter", 9), bg="#D3D3D3")
+        self.search_status_label.pack(side="left", padx=5)
+        self.root.bind("<Control-f>", lambda e: self.search_entry.focus_set())
+
+        # Page thumbnail sidebar to the left of the PDF canvas
+        thumbnail_frame = Frame(self.frame_pdf, bg="#C0C0C0")
+        thumbnail_frame.pack(side="left", fill="y")
+        self.canvas_thumbs = Canvas(
+            thumbnail_frame,
+            width=THUMBNAIL_WIDTH_PX + 20,
+            bg="#C0C0C0",
+            bd=0,
+            highlightthickness=0
+        )
+        self.thumbs_scrollbar = Scrollbar(thumbnail_frame, orient=VERTICAL, command=self._on_thumbnail_scrollbar)
+        self.thumbs_scrollbar.pack(side=RIGHT, fill=Y)
+        self.canvas_thumbs.pack(side=LEFT, fill=Y)
+        self.canvas_thumbs.config(yscrollcommand=self.thumbs_scrollbar.set)
+        self.canvas_thumbs.bind("<Configure>", lambda e: self._schedule_thumbnail_update())
+        self.canvas_thumbs.bind("<MouseWheel>", self._on_thumbnail_mousewheel)
+        self.canvas_thumbs.bind("<Button-4>", lambda e: self._scroll_thumbnails(-1))
+        self.canvas_thumbs.bind("<Button-5>", lambda e: self._scroll_thumbnails(1))
+        self.canvas_thumbs.bind("<ButtonRelease-1>", self._on_thumbnail_click)
+
         # Canvas for PDF content
         self.canvas_pdf = Canvas(
             self.frame_pdf,
@@ -289,6 +2319,8 @@ class HSEReportPortalApp:
         self.canvas_pdf.bind("<ButtonPress-1>", self.on_drag_start)
         self.canvas_pdf.bind("<B1-Motion>", self.on_drag_motion)
         self.canvas_pdf.bind("<ButtonRelease-1>", self.on_drag_end)
+        self.canvas_pdf.bind("<Button-3>", self._on_canvas_right_click)
+        self.root.bind("<Delete>", self.remove_selected_signature)
 
         # Initial "PDF PORTAL" text on the canvas
         self.canvas_pdf.create_text(
@@ -365,6 +2397,10 @@ class HSEReportPortalApp:
         self.btn_load_pdf.grid(row=button_start_row, column=0, columnspan=2, pady=button_pady_common, sticky="ew")
         button_start_row += 1
 
+        self.btn_find_report = self.create_rounded_button(officer_buttons_frame, "FIND REPORT", self.open_report_finder, "#A7C7E7", pady_val=button_pady_common)
+        self.btn_find_report.grid(row=button_start_row, column=0, columnspan=2, pady=button_pady_common, sticky="ew")
+        button_start_row += 1
+
         self.btn_apply_sign = self.create_rounded_button(officer_buttons_frame, "APPLY ESIGN", self.apply_signature, "#90EE90", font=("Inter", 10, "bold"), pady_val=8)
         self.btn_apply_sign.grid(row=button_start_row, column=0, columnspan=2, pady=(15, 5), sticky="ew")
         button_start_row += 1
@@ -373,6 +2409,23 @@ class HSEReportPortalApp:
         self.btn_save_pdf.grid(row=button_start_row, column=0, columnspan=2, pady=5, sticky="ew")
         button_start_row += 1
 
+        save_mode_label = Label(officer_buttons_frame, text="Save mode", bg="#D3D3D3", fg="#111827", font=("Inter", 10, "bold"))
+        save_mode_label.grid(row=button_start_row, column=0, pady=(2, 5), padx=5, sticky="w")
+        self.save_mode_combobox = Combobox(officer_buttons_frame, state="readonly", values=SAVE_MODES, font=("Inter", 10))
+        self.save_mode_combobox.set(SAVE_MODE_FULL)
+        self.save_mode_combobox.grid(row=button_start_row, column=1, pady=(2, 5), padx=5, sticky="ew")
+        button_start_row += 1
+
+        # Shown only while a save is running
+        self.save_progress_label = Label(officer_buttons_frame, text="", bg="#D3D3D3", fg="#111827", font=("Inter", 9))
+        self.save_progress_label.grid(row=button_start_row, column=0, columnspan=2, padx=5, sticky="w")
+        self.save_progress_label.grid_remove()
+        button_start_row += 1
+        self.save_progress_bar = Progressbar(officer_buttons_frame, mode="determinate")
+        self.save_progress_bar.grid(row=button_start_row, column=0, columnspan=2, padx=5, pady=(0, 5), sticky="ew")
+        self.save_progress_bar.grid_remove()
+        button_start_row += 1
+
         # Error Box
         error_box_label = Label(self.controls_frame, text="ERROR BOX", font=("Inter", 12, "bold"), bg="#D3D3D3")
         error_box_label.grid(row=2, column=0, padx=10, pady=(20, 5), sticky="w")
@@ -404,8 +2457,45 @@ class HSEReportPortalApp:
 
     def _recenter_pdf_portal_text(self, event):
         # Recenter the "PDF PORTAL" text when the canvas is resized, if no PDF is loaded
-        if not self.pdf_doc and self.canvas_pdf.find_withtag("pdf_portal_text"):
+        if not self.session.doc and self.canvas_pdf.find_withtag("pdf_portal_text"):
             self.canvas_pdf.coords("pdf_portal_text", event.width / 2, event.height / 2)
+        # A larger canvas may expose tiles that have not been rendered yet
+        self._schedule_visible_tiles_update()
+
+    def _post_to_ui(self, callback, *args):
+        """Schedules callback(*args) on the Tk thread; safe to call from any thread."""
+        self._ui_queue.put((callback, args))
+
+    def _drain_ui_queue(self):
+        """Runs callbacks posted by background workers, then re-arms itself with root.after."""
+        try:
+            while True:
+                try:
+                    callback, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(*args)
+                except Exception as e:
+                    # One failing callback (e.g. for a widget that is gone) must not stop the others
+                    traceback.print_exc()
+                    self.log_error(f"Background update failed: {e}")
+        finally:
+            self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+    def on_close(self):
+        self.render_worker.shutdown()
+        self.db_executor.shutdown(wait=False, cancel_futures=True)
+        self.thumbnail_dispatcher.shutdown(wait=False, cancel_futures=True)
+        if self.thumbnail_pool is not None:
+            self.thumbnail_pool.shutdown(wait=False, cancel_futures=True)
+        # A save that is already writing is allowed to finish so the output file is never left half-written
+        self.save_dispatcher.shutdown(wait=False, cancel_futures=True)
+        if self.save_pool is not None:
+            self.save_pool.shutdown(wait=False, cancel_futures=True)
+        if self.report_catalog is not None:
+            self.report_catalog.close()
+        self.root.destroy()
 
     def log_error(self, msg):
         self.error_text.configure(state="normal")
@@ -414,68 +2504,80 @@ class HSEReportPortalApp:
         self.error_text.configure(state="disabled")
 
     def fetch_names(self):
+        """Loads officer names on a background thread; the dropdowns show a loading state meanwhile."""
+        for dropdown in self.officer_dropdowns.values():
+            dropdown['values'] = ["Loading names..."]
+            dropdown.set("Loading names...")
+            dropdown.config(state="disabled")
+        self.db_executor.submit(self._fetch_names_worker)
+
+    def _fetch_names_worker(self):
+        # Runs on a db_executor thread: no Tk calls here, results are posted back to the Tk thread
+        db_error = None
         try:
-            conn = mysql.connector.connect(host="localhost", user="root", password="password", database="project")
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM iocl ORDER BY empid ASC")
-            result = cursor.fetchall()
-            all_names = [row[0] for row in result]
-            conn.close()
-
-            name_index = 0
-
-            for role_title in self.officer_roles_config:
-                dropdown = self.officer_dropdowns[role_title]
-                options_for_dropdown = ["--Please select Name--"]
-                
-                if name_index < len(all_names):
-                    options_for_dropdown.append(all_names[name_index])
-                    name_index += 1
-
-                dropdown['values'] = options_for_dropdown
-                dropdown.set(options_for_dropdown[0])
-
+            all_names = self.officer_repository.fetch_officer_names()
+            save_cached_officer_names(all_names)
         except Exception as e:
-            self.log_error(f"DB Error fetching names: {e}")
+            # Keep the portal usable (read-only) with the officer list from the last successful launch
+            all_names = load_cached_officer_names()
+            db_error = e
+        self._post_to_ui(self._populate_officer_dropdowns, all_names, db_error)
 
-    def set_report_date_from_filename(self, path):
-        filename = Path(path).stem
-        m = re.search(r"hse_report[_]?(\d{2})(\d{2})(\d{4})", filename, re.I)
-        if m:
-            day, month, year = m.groups()
-            try:
-                dt = datetime.strptime(f"{day}{month}{year}", "%d%m%Y")
-                formatted = dt.strftime("%d:%m:%Y")
-            except Exception:
-                formatted = f"{day}:{month}:{year}"
-            self.report_date_entry.configure(state="normal")
-            self.report_date_entry.delete(1.0, 'end')
-            self.report_date_entry.insert('end', formatted)
-            self.report_date_entry.configure(state="disabled")
-        else:
-            self.report_date_entry.configure(state="normal")
-            self.report_date_entry.delete(1.0, 'end')
-            self.report_date_entry.insert('end', "Unknown")
-            self.report_date_entry.configure(state="disabled")
+    def _populate_officer_dropdowns(self, all_names, db_error):
+        name_index = 0
+
+        for role_title in self.officer_roles_config:
+            dropdown = self.officer_dropdowns[role_title]
+            options_for_dropdown = ["--Please select Name--"]
+            
+            if all_names and name_index < len(all_names):
+                options_for_dropdown.append(all_names[name_index])
+                name_index += 1
+
+            dropdown.config(state="readonly")
+            dropdown['values'] = options_for_dropdown
+            dropdown.set(options_for_dropdown[0])
+
+        if db_error is not None and all_names is not None:
+            self.log_error(f"DB Error fetching names: {db_error}. Showing the locally cached officer list.")
+        elif db_error is not None:
+            self.log_error(f"DB Error fetching names: {db_error}")
+
+    def _show_report_date(self, path):
+        """Shows the report date taken from the file name, the PDF metadata or the first page's text."""
+        report_date, _ = extract_report_date(self.session.doc, path)
+        self.report_date_entry.configure(state="normal")
+        self.report_date_entry.delete(1.0, 'end')
+        self.report_date_entry.insert('end', report_date.strftime("%d:%m:%Y") if report_date else "Unknown")
+        self.report_date_entry.configure(state="disabled")
 
     def load_pdf(self):
+        if self._block_while_saving():
+            return
         path = filedialog.askopenfilename(filetypes=[("PDF Files", "*.pdf")])
-        if not path:
+        if path:
+            self.open_pdf(path)
+
+    def open_pdf(self, path):
+        if self._block_while_saving():
             return
         try:
-            self.pdf_path = path
-            self.pdf_doc = fitz.open(path)
+            self.session.open(path) # Also clears the previous document's placed signatures
             self.current_page_num = 0
             self.signature_position_pdf = None
-            self.placed_signatures = {} # Clear placed signatures when new PDF is loaded
+            self.displayed_view_key = None # Force a full canvas rebuild even when the same file is reopened
+            self._reset_text_search()
+            self.thumbnail_dispatcher.submit(
+                self._build_text_index, self.session.doc_key, path, self.session.doc.page_count
+            )
 
             # Ensure the canvas has its current dimensions before calculating zoom
             self.root.update_idletasks() 
             
-            page = self.pdf_doc.load_page(self.current_page_num)
+            page_rect = self.session.page_rect(self.current_page_num)
             
-            pdf_width_pts = page.rect.width
-            pdf_height_pts = page.rect.height
+            pdf_width_pts = page_rect.width
+            pdf_height_pts = page_rect.height
 
             # Get the effective drawable width and height of the canvas
             canvas_width_px = self.canvas_pdf.winfo_width()
@@ -489,22 +2591,129 @@ class HSEReportPortalApp:
                 self.current_zoom = min(zoom_factor_for_width, zoom_factor_for_height)
                 self.current_zoom = max(0.2, self.current_zoom) # Minimum zoom to prevent too small
                 self.current_zoom = min(3.0, self.current_zoom)  # Maximum initial zoom to prevent too large
+            self.current_zoom = quantize_zoom(self.current_zoom)
 
 
             self.render_pdf_page()
-            self.set_report_date_from_filename(path)
+            self._reset_thumbnail_strip()
+            self._update_page_indicator()
+            self._show_report_date(path)
+            self.opened_report_folders.add(Path(path).resolve().parent)
             self.log_error("")
         except Exception as e:
             self.log_error(f"Failed to load PDF: {e}")
-            self.pdf_doc = None
+            self.session.close()
+            self._reset_text_search()
+            self._reset_thumbnail_strip()
+            self._update_page_indicator()
+            self.displayed_view_key = None
             self.canvas_pdf.delete("all")
             self.canvas_pdf.create_text(
                 self.canvas_pdf.winfo_width() / 2, self.canvas_pdf.winfo_height() / 2,
                 text="PDF PORTAL", font=("Inter", 18, "bold"), fill="#808080", tags="pdf_portal_text"
             )
 
+    def open_report_finder(self):
+        """Opens the report finder and refreshes the catalog of the known report folders in the background."""
+        if self.report_finder is not None and self.report_finder.winfo_exists():
+            self.report_finder.lift()
+            return
+        if self.report_catalog is None:
+            try:
+                self.report_catalog = ReportCatalog()
+            except sqlite3.Error as e:
+                self.log_error(f"Report catalog unavailable: {e}")
+                return
+
+        finder = Toplevel(self.root)
+        finder.title("Find Report")
+        finder.configure(bg="#F0F0F0")
+        finder.geometry("720x420")
+        self.report_finder = finder
+
+        filters = Frame(finder, bg="#F0F0F0")
+        filters.pack(fill="x", padx=10, pady=(10, 5))
+        self.finder_entries = {}
+        for column, label in enumerate(("From", "To", "Officer")):
+            Label(filters, text=label, bg="#F0F0F0", font=("Inter", 9, "bold")).grid(row=0, column=column, sticky="w", padx=(0, 5))
+            entry = Entry(filters, width=14, font=("Inter", 9))
+            entry.grid(row=1, column=column, sticky="ew", padx=(0, 5))
+            entry.bind("<Return>", lambda e: self._run_report_search())
+            self.finder_entries[label] = entry
+        Label(filters, text="Status", bg="#F0F0F0", font=("Inter", 9, "bold")).grid(row=0, column=3, sticky="w", padx=(0, 5))
+        self.finder_status = Combobox(filters, values=["Any", "signed", "unsigned"], state="readonly", width=10, font=("Inter", 9))
+        self.finder_status.set("Any")
+        self.finder_status.grid(row=1, column=3, sticky="ew", padx=(0, 5))
+        self.finder_status.bind("<<ComboboxSelected>>", lambda e: self._run_report_search())
+        self.create_rounded_button(filters, "SEARCH", self._run_report_search, "#A7C7E7", pady_val=2).grid(row=1, column=4, sticky="ew")
+
+        self.finder_status_label = Label(finder, text="", bg="#F0F0F0", fg="#555555", font=("Inter", 9), anchor="w")
+        self.finder_status_label.pack(fill="x", padx=10)
+
+        results_frame = Frame(finder)
+        results_frame.pack(fill="both", expand=True, padx=10, pady=(5, 10))
+        results_scroll = Scrollbar(results_frame, orient="vertical")
+        results_scroll.pack(side="right", fill="y")
+        self.finder_results = Listbox(results_frame, font=("Consolas", 9), yscrollcommand=results_scroll.set, activestyle="none")
+        self.finder_results.pack(side="left", fill="both", expand=True)
+        results_scroll.config(command=self.finder_results.yview)
+        self.finder_results.bind("<Double-Button-1>", self._open_found_report)
+        self.finder_paths = []
+
+        self._run_report_search()
+        if self.catalog_folders or self.opened_report_folders:
+            self.finder_status_label.config(text="Updating catalog...")
+            self.db_executor.submit(
+                self._update_catalog_worker, list(self.catalog_folders), sorted(self.opened_report_folders)
+            )
+        else:
+            self.finder_status_label.config(text="No report folders yet: set HSE_REPORT_DIRS or open a report.")
+
+    def _update_catalog_worker(self, folders, shallow_folders):
+        # Runs on a db_executor thread: no Tk calls here, results are posted back to the Tk thread
+        try:
+            counts = self.report_catalog.update(folders, shallow_folders=shallow_folders)
+            message = f"Catalog up to date ({counts['indexed']} indexed, {counts['removed']} removed, {counts['unchanged']} unchanged)."
+        except Exception as e:
+            message = f"Catalog update failed: {e}"
+        self._post_to_ui(self._on_catalog_updated, message)
+
+    def _on_catalog_updated(self, message):
+        if self.report_finder is None or not self.report_finder.winfo_exists():
+            return
+        self._run_report_search()
+        self.finder_status_label.config(text=message)
+
+    def _run_report_search(self):
+        dates = {}
+        for label in ("From", "To"):
+            text = self.finder_entries[label].get().strip()
+            dates[label] = find_report_date(text) if text else None
+            if text and dates[label] is None:
+                self.finder_status_label.config(text=f"'{text}' is not a date (use DD.MM.YYYY).")
+                return
+        status = self.finder_status.get()
+        results = self.report_catalog.search(
+            date_from=dates["From"], date_to=dates["To"],
+            officer=self.finder_entries["Officer"].get().strip() or None,
+            status=None if status == "Any" else status
+        )
+        self.finder_results.delete(0, END)
+        self.finder_paths = []
+        for result in results:
+            report_date = datetime.strptime(result['report_date'], "%Y-%m-%d").strftime("%d.%m.%Y") if result['report_date'] else "??.??.????"
+            officers = ", ".join(result['officers'])
+            self.finder_results.insert(END, f"{report_date}  {result['status']:<8}  {Path(result['path']).name}  {officers}")
+            self.finder_paths.append(result['path'])
+        self.finder_status_label.config(text=f"{len(results)} report(s) found.")
+
+    def _open_found_report(self, event=None):
+        selection = self.finder_results.curselection()
+        if selection:
+            self.open_pdf(self.finder_paths[selection[0]])
+
     def render_pdf_page(self):
-        if not self.pdf_doc:
+        if not self.session.doc:
             if not self.canvas_pdf.find_withtag("pdf_portal_text"):
                 self.canvas_pdf.create_text(
                     self.canvas_pdf.winfo_width() / 2, self.canvas_pdf.winfo_height() / 2,
@@ -512,63 +2721,107 @@ class HSEReportPortalApp:
                 )
             return
 
-        self.canvas_pdf.delete("pdf_portal_text")
-        self.canvas_pdf.delete("sig_preview_rect")
-        self.canvas_pdf.delete("sig_preview_img")
-        self.canvas_pdf.delete("sig_display_top_right")
-
-        page = self.pdf_doc.load_page(self.current_page_num)
-        mat = fitz.Matrix(self.current_zoom, self.current_zoom)
-        pix = page.get_pixmap(matrix=mat)
-
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        self.pdf_img_tk = ImageTk.PhotoImage(img)
-
-        self.canvas_pdf.delete("all")
-        self.canvas_pdf.config(scrollregion=(0, 0, pix.width, pix.height))
-        
-        self.canvas_pdf.create_image(0, 0, anchor="nw", image=self.pdf_img_tk)
-
-        # Draw all currently 'placed' signatures for the current page
-        if self.current_page_num in self.placed_signatures:
-            for sig_info in self.placed_signatures[self.current_page_num]:
-                pil_img_placed = sig_info['pil_img']
-                pdf_x_placed, pdf_y_placed = sig_info['position'] # pdf_y_placed is bottom-left origin
+        page_rect = self.session.page_rect(self.current_page_num)
+        tiled = self._use_tiled_rendering(page_rect)
+        bitmap = None
+        if not tiled:
+            bitmap = self.page_render_cache.get(
+                PageRenderCache.make_key(self.session.doc_key, self.current_page_num, self.current_zoom)
+            )
+            if bitmap is None:
+                # Rasterize in the background; _on_page_rendered calls back here once the bitmap is cached.
+                # Meanwhile draw a stretched lower-resolution stand-in if one is available.
+                bitmap = self._request_page_render(page_rect)
+                if bitmap is None:
+                    return
+
+        view_key = (self.session.doc_key, self.current_page_num, quantize_zoom(self.current_zoom))
+        if view_key == self.displayed_view_key:
+            # Same page and zoom: only the page layer changes, the overlay items stay where they are
+            if bitmap:
+                self.pdf_img_tk = bitmap['tk_img']
+                self.canvas_pdf.itemconfig("page_bitmap", image=self.pdf_img_tk)
+                if not bitmap.get('placeholder'):
+                    self.canvas_pdf.delete("saved_sig") # The saved file's render has the signatures baked in
+            else:
+                self._update_visible_tiles()
+        else:
+            # New page or zoom: rebuild the canvas from scratch
+            self.displayed_view_key = view_key
+            self.displayed_page_key = (self.session.doc_key, self.current_page_num)
+            self.displayed_tiles = {}
+            self.displayed_tile_placeholders = {}
+            self.selected_placed_signature = None
 
-                sig_height_pt_placed = sig_info['target_height_pt']
+            self.canvas_pdf.delete("all")
+            if bitmap:
+                self.pdf_img_tk = bitmap['tk_img']
+                self.canvas_pdf.config(scrollregion=(0, 0, self.pdf_img_tk.width(), self.pdf_img_tk.height()))
+                self.canvas_pdf.create_image(0, 0, anchor="nw", image=self.pdf_img_tk, tags="page_bitmap")
+            else:
+                # Tiled mode: only tiles around the visible region are drawn, the rest is fetched as the user pans
+                self.pdf_img_tk = None
+                self.canvas_pdf.config(scrollregion=(0, 0, page_rect.width * self.current_zoom, page_rect.height * self.current_zoom))
+                self._update_visible_tiles()
+                # Run again once zoom_in/zoom_out have re-centred the view
+                self._schedule_visible_tiles_update(delay_ms=0)
+
+            # Draw all currently 'placed' signatures for the current page
+            for sig_info in self.session.placements.get(self.current_page_num, []):
+                self._draw_signature_overlay(sig_info, page_rect.height)
+            self._draw_search_highlights()
+            self._draw_active_signature_preview()
+
+        if bitmap and not bitmap.get('placeholder'):
+            # The current page is sharp, so the worker is free to render its neighbours ahead of time
+            self._prefetch_adjacent_pages()
+
+    def _is_current_view_displayed(self):
+        return self.displayed_view_key == (self.session.doc_key, self.current_page_num, quantize_zoom(self.current_zoom))
+
+    def _draw_signature_overlay(self, sig_info, page_height_pdf_pts):
+        """Creates the canvas items (image + dashed border) for one placed signature at the current zoom."""
+        # Placements are stored in PDF points with a bottom-left origin; the canvas is top-left
+        canvas_x_for_placed, canvas_y_for_placed, canvas_x1, canvas_y1 = self.session.view_rect(
+            sig_info, page_height_pdf_pts, self.current_zoom
+        )
+        placed_preview_width_on_canvas = canvas_x1 - canvas_x_for_placed
+        placed_preview_height_on_canvas = canvas_y1 - canvas_y_for_placed
 
-                # Convert PDF bottom-left origin (pdf_x_placed, pdf_y_placed)
-                # to Tkinter canvas top-left origin for drawing.
-                # canvas_y = (page_height_in_pixels) - (sig_bottom_y_in_pixels + sig_height_in_pixels)
-                page_height_pdf_pts = page.rect.height # Get actual page height in PDF points
-                canvas_x_for_placed = pdf_x_placed * self.current_zoom
-                canvas_y_for_placed = (page_height_pdf_pts - (pdf_y_placed + sig_height_pt_placed)) * self.current_zoom
+        if placed_preview_width_on_canvas <= 0 or placed_preview_height_on_canvas <= 0:
+            return
+        sig_info['tk_img_on_canvas'] = self.scaled_signature_cache.get_photo(
+            sig_info['name'], sig_info['pil_img'], (placed_preview_width_on_canvas, placed_preview_height_on_canvas)
+        )
+        image_id = self.canvas_pdf.create_image(
+            canvas_x_for_placed, canvas_y_for_placed,
+            anchor="nw",
+            image=sig_info['tk_img_on_canvas'],
+            tags=("placed_sig", f"placed_sig_{id(sig_info)}")
+        )
+        border_id = self.canvas_pdf.create_rectangle(
+            canvas_x_for_placed, canvas_y_for_placed, canvas_x1, canvas_y1,
+            outline="red" if sig_info is self.selected_placed_signature else "gray", width=1, dash=(2,2),
+            tags=("placed_sig_border", f"placed_sig_{id(sig_info)}")
+        )
+        sig_info['canvas_items'] = (image_id, border_id)
 
+    def _remove_signature_overlay(self, sig_info):
+        """Deletes only the canvas items belonging to one placed signature."""
+        for item_id in sig_info.pop('canvas_items', ()):
+            self.canvas_pdf.delete(item_id)
+        sig_info.pop('tk_img_on_canvas', None)
 
-                placed_preview_width_on_canvas = sig_info['target_width_pt'] * self.current_zoom
-                placed_preview_height_on_canvas = sig_info['target_height_pt'] * self.current_zoom
-                
-                if placed_preview_width_on_canvas > 0 and placed_preview_height_on_canvas > 0:
-                    scaled_pil_placed_sig = pil_img_placed.resize(
-                        (int(placed_preview_width_on_canvas), int(placed_preview_height_on_canvas)), Image.LANCZOS
-                    )
-                    sig_info['tk_img_on_canvas'] = ImageTk.PhotoImage(scaled_pil_placed_sig)
-                    self.canvas_pdf.create_image(
-                        canvas_x_for_placed, canvas_y_for_placed,
-                        anchor="nw",
-                        image=sig_info['tk_img_on_canvas'],
-                        tags=f"placed_sig_{sig_info['name']}_{id(sig_info)}" 
-                    )
-                    self.canvas_pdf.create_rectangle(
-                        canvas_x_for_placed, canvas_y_for_placed,
-                        canvas_x_for_placed + placed_preview_width_on_canvas,
-                        canvas_y_for_placed + placed_preview_height_on_canvas,
-                        outline="gray", width=1, dash=(2,2),
-                        tags=f"placed_sig_border_{id(sig_info)}"
-                    )
+    def _show_placed_signature(self, sig_info):
+        """Draws just the overlay of a placement the session has just recorded on the current page."""
+        if self._is_current_view_displayed():
+            self._draw_signature_overlay(sig_info, self.session.page_height(self.current_page_num))
 
+    def _draw_active_signature_preview(self):
+        """(Re)draws the top-right preview of the signature active for manual placement."""
+        self.canvas_pdf.delete("sig_display_top_right")
         # Show active signature preview at top right if one is selected for manual placement
-        if self.current_active_signature_data['tk_img']:
+        if self.current_active_signature_data['tk_img'] and self.session.doc:
             canvas_width = self.canvas_pdf.winfo_width()
             if canvas_width <= 1:
                 canvas_width = self.root.winfo_width() / 2 - 10
@@ -582,17 +2835,574 @@ class HSEReportPortalApp:
                 tags="sig_display_top_right"
             )
 
+    def _on_canvas_right_click(self, event):
+        """Selects the placed signature under the cursor (highlighted red); press Delete to remove it."""
+        if not self.session.doc:
+            return
+        canvas_x = self.canvas_pdf.canvasx(event.x)
+        canvas_y = self.canvas_pdf.canvasy(event.y)
+        hit_items = set(self.canvas_pdf.find_overlapping(canvas_x, canvas_y, canvas_x, canvas_y))
+        selected = None
+        # Topmost placement wins when signatures overlap
+        for sig_info in reversed(self.session.placements.get(self.current_page_num, [])):
+            if hit_items.intersection(sig_info.get('canvas_items', ())):
+                selected = sig_info
+                break
+        self._select_placed_signature(selected)
+
+    def _select_placed_signature(self, sig_info):
+        previous = self.selected_placed_signature
+        if previous is not None and previous.get('canvas_items'):
+            self.canvas_pdf.itemconfig(previous['canvas_items'][1], outline="gray")
+        self.selected_placed_signature = sig_info
+        if sig_info is not None:
+            if sig_info.get('canvas_items'):
+                self.canvas_pdf.itemconfig(sig_info['canvas_items'][1], outline="red")
+            self.log_error(f"Selected placed signature '{sig_info['name']}'. Press Delete to remove it.")
+
+    def remove_selected_signature(self, event=None):
+        if event is not None and isinstance(self.root.focus_get(), (Entry, Text)):
+            return # Delete is editing text (page number, FIND box), not removing a signature
+        sig_info = self.selected_placed_signature
+        if sig_info is None or self._block_while_saving():
+            return
+        self.session.remove(self.current_page_num, sig_info)
+        self._remove_signature_overlay(sig_info)
+        self.selected_placed_signature = None
+        self.log_error(f"Removed signature '{sig_info['name']}' from page {self.current_page_num + 1}.")
+
+    def _request_page_render(self, page_rect):
+        """
+        Hands the current page/zoom to the render worker, superseding any older request.
+        Returns a placeholder bitmap (the best cached render of this page stretched to the
+        new size) to show until the sharp render arrives, or None if there is nothing to stretch.
+        """
+        cache_key = PageRenderCache.make_key(self.session.doc_key, self.current_page_num, self.current_zoom)
+        job = self.pending_render_job
+        if not (job and job['cache_key'] == cache_key and self.render_worker.is_current(job)):
+            job = {
+                'path': self.session.path,
+                'doc_key': self.session.doc_key,
+                'page_num': self.current_page_num,
+                'zoom': self.current_zoom,
+                'cache_key': cache_key
+            }
+            best_zoom, _ = self.page_render_cache.find_best(self.session.doc_key, self.current_page_num)
+            preview_zoom = quantize_zoom(min(PROGRESSIVE_PREVIEW_ZOOM, self.current_zoom))
+            page_on_screen = self.displayed_page_key == (self.session.doc_key, self.current_page_num)
+            if best_zoom is None and not page_on_screen and preview_zoom < quantize_zoom(self.current_zoom):
+                # First sight of this page: a cheap low-DPI pass goes ahead of the sharp render
+                self.render_worker.submit({
+                    'path': self.session.path,
+                    'doc_key': self.session.doc_key,
+                    'page_num': self.current_page_num,
+                    'zoom': preview_zoom,
+                    'preview': True
+                })
+                self.render_worker.submit(job, supersede=False)
+            else:
+                self.render_worker.submit(job)
+            self.pending_render_job = job
+
+        placeholder = self._scaled_page_placeholder(page_rect)
+        if placeholder is None and self.displayed_page_key != (self.session.doc_key, self.current_page_num):
+            # Nothing from this page is on screen yet, so don't leave the previous document/page showing
+            self.displayed_view_key = None
+            self.canvas_pdf.delete("all")
+            self.canvas_pdf.create_text(
+                self.canvas_pdf.winfo_width() / 2, self.canvas_pdf.winfo_height() / 2,
+                text="Rendering page...", font=("Inter", 14, "bold"), fill="#808080", tags="pdf_portal_text"
+            )
+        if placeholder is None:
+            # The final bitmap size is known up front, so scrolling and zoom re-centering work immediately
+            self.canvas_pdf.config(scrollregion=(0, 0, page_rect.width * self.current_zoom, page_rect.height * self.current_zoom))
+        return placeholder
+
+    def _scaled_page_placeholder(self, page_rect):
+        """Stretches the sharpest cached bitmap of the current page to the current zoom (not cached)."""
+        best_zoom, best = self.page_render_cache.find_best(self.session.doc_key, self.current_page_num)
+        if best is None:
+            return None
+        target_size = (max(1, int(page_rect.width * self.current_zoom)), max(1, int(page_rect.height * self.current_zoom)))
+        scaled = best['pil_img'].resize(target_size, Image.BILINEAR)
+        return {'pil_img': scaled, 'tk_img': ImageTk.PhotoImage(scaled), 'placeholder': True}
+
+    def _on_render_worker_result(self, job, result, error):
+        # Runs on the dispatcher thread; hop over to the Tk thread before touching widgets
+        self._post_to_ui(self._on_page_rendered, job, result, error)
+
+    def _on_page_rendered(self, job, result, error):
+        """Caches a bitmap delivered by the render worker and shows it if it is still what the user wants."""
+        if job is self.pending_render_job:
+            self.pending_render_job = None
+        if error is not None:
+            if self.render_worker.is_current(job):
+                self.log_error(f"Failed to render page {job['page_num'] + 1}: {error}")
+            return
+        if job['doc_key'] != self.session.doc_key:
+            return # The document was closed or replaced while the worker was busy
+        width, height, samples = result
+        img = Image.frombytes("RGB", [width, height], samples)
+        bitmap = self.page_render_cache.put(
+            PageRenderCache.make_key(job['doc_key'], job['page_num'], job['zoom'], job.get('tile')),
+            img, ImageTk.PhotoImage(img)
+        )
+        if job.get('preview'):
+            # Show the low-DPI pass stretched to size while the sharp render for this page is still running
+            if job['page_num'] == self.current_page_num and self.render_worker.is_current(job):
+                self.render_pdf_page()
+            return
+        if self.prefetch_jobs.get(job.get('cache_key')) is job:
+            del self.prefetch_jobs[job['cache_key']]
+        if job['page_num'] != self.current_page_num or quantize_zoom(job['zoom']) != quantize_zoom(self.current_zoom):
+            return
+        if job.get('tile') is not None:
+            # Only this tile changed: add it under the overlays without redrawing the page
+            if self.displayed_page_key == (self.session.doc_key, self.current_page_num):
+                self._draw_tile(job['tile'], bitmap)
+        elif self.render_worker.is_current(job) or job.get('prefetch'):
+            self.render_pdf_page()
+
+    def _prefetch_adjacent_pages(self):
+        """Queues background renders of pages N-1 and N+1 at the current zoom so page turns hit the cache."""
+        for page_num in (self.current_page_num + 1, self.current_page_num - 1):
+            if not 0 <= page_num < self.session.doc.page_count:
+                continue
+            if self._use_tiled_rendering(self.session.page_rect(page_num)):
+                continue # Tiled pages are rendered on demand around the viewport only
+            cache_key = PageRenderCache.make_key(self.session.doc_key, page_num, self.current_zoom)
+            if self.page_render_cache.get(cache_key) is not None:
+                continue
+            pending = self.prefetch_jobs.get(cache_key)
+            if pending is not None and self.render_worker.is_current(pending):
+                continue
+            job = {
+                'path': self.session.path,
+                'doc_key': self.session.doc_key,
+                'page_num': page_num,
+                'zoom': self.current_zoom,
+                'cache_key': cache_key,
+                'prefetch': True,
+                'keep_if_stale': True
+            }
+            self.prefetch_jobs[cache_key] = job
+            # Appended behind the current request so it never delays what the user is looking at
+            self.render_worker.submit(job, supersede=False)
+
+    def go_to_page(self, page_num):
+        """Shows another page of the open PDF, keeping the current zoom."""
+        if not self.session.doc:
+            self.log_error("No PDF loaded.")
+            return
+        if not 0 <= page_num < self.session.doc.page_count:
+            self.log_error(f"Page {page_num + 1} is out of range (1-{self.session.doc.page_count}).")
+            self._update_page_indicator()
+            return
+        if page_num == self.current_page_num:
+            return
+        self.current_page_num = page_num
+        self.signature_position_pdf = None # A pending manual position belongs to the page being left
+        self.canvas_pdf.xview_moveto(0)
+        self.canvas_pdf.yview_moveto(0)
+        self.render_pdf_page()
+        self._update_page_indicator()
+
+    def next_page(self):
+        if self.session.doc:
+            self.go_to_page(self.current_page_num + 1)
+
+    def prev_page(self):
+        if self.session.doc:
+            self.go_to_page(self.current_page_num - 1)
+
+    def _on_page_entry_submit(self, event):
+        try:
+            page_num = int(self.page_entry.get().strip()) - 1
+        except ValueError:
+            self.log_error("Enter a page number to jump to.")
+            self._update_page_indicator()
+            return
+        self.go_to_page(page_num)
+
+    def _update_page_indicator(self):
+        self.page_entry.delete(0, END)
+        if self.session.doc:
+            self.page_entry.insert(0, str(self.current_page_num + 1))
+            self.page_count_label.config(text=f"/ {self.session.doc.page_count}")
+        else:
+            self.page_count_label.config(text="/ 0")
+        self._highlight_current_thumbnail()
+
+    def _reset_thumbnail_strip(self):
+        """Lays out one empty slot per page; thumbnails are only generated once their slot scrolls into view."""
+        self.canvas_thumbs.delete("all")
+        self.thumbnail_images = {}
+        self.thumbnails_requested = set()
+        if not self.session.doc:
+            self.canvas_thumbs.config(scrollregion=(0, 0, 0, 0))
+            return
+        # Slots share the first page's aspect ratio; odd-sized pages are scaled to fit their slot
+        first_page_rect = self.session.page_rect(0)
+        thumb_height = int(THUMBNAIL_WIDTH_PX * first_page_rect.height / first_page_rect.width)
+        self.thumbnail_slot_height = thumb_height + THUMBNAIL_SLOT_PADDING_PX
+        slot_x = 10
+        for page_num in range(self.session.doc.page_count):
+            slot_y = page_num * self.thumbnail_slot_height + 6
+            self.canvas_thumbs.create_rectangle(
+                slot_x, slot_y, slot_x + THUMBNAIL_WIDTH_PX, slot_y + thumb_height,
+                fill="", outline="#808080", tags=("thumb_frame", f"thumb_frame_{page_num}")
+            )
+            self.canvas_thumbs.create_text(
+                slot_x + THUMBNAIL_WIDTH_PX / 2, slot_y + thumb_height + 9,
+                text=str(page_num + 1), font=("Inter", 8, "bold"), fill="#111827"
+            )
+        self.canvas_thumbs.config(scrollregion=(0, 0, THUMBNAIL_WIDTH_PX + 20, self.session.doc.page_count * self.thumbnail_slot_height + 6))
+        self.canvas_thumbs.yview_moveto(0)
+        self._highlight_current_thumbnail()
+        self._schedule_thumbnail_update()
+
+    def _highlight_current_thumbnail(self):
+        self.canvas_thumbs.itemconfig("thumb_frame", outline="#808080", width=1)
+        if self.session.doc:
+            self.canvas_thumbs.itemconfig(f"thumb_frame_{self.current_page_num}", outline="#F47D23", width=3)
+            self.canvas_thumbs.tag_raise(f"thumb_frame_{self.current_page_num}")
+
+    def _on_thumbnail_scrollbar(self, *args):
+        self.canvas_thumbs.yview(*args)
+        self._schedule_thumbnail_update()
+
+    def _on_thumbnail_mousewheel(self, event):
+        self._scroll_thumbnails(-1 if event.delta > 0 else 1)
+
+    def _scroll_thumbnails(self, direction):
+        self.canvas_thumbs.yview_scroll(direction * 3, "units")
+        self._schedule_thumbnail_update()
+
+    def _schedule_thumbnail_update(self):
+        if self.thumbnail_update_id is not None:
+            self.root.after_cancel(self.thumbnail_update_id)
+        self.thumbnail_update_id = self.root.after(TILE_UPDATE_DELAY_MS, self._update_visible_thumbnails)
+
+    def _update_visible_thumbnails(self):
+        """Requests thumbnails for the slots currently scrolled into view (plus one slot either side)."""
+        self.thumbnail_update_id = None
+        if not self.session.doc or not self.thumbnail_slot_height:
+            return
+        view_top = self.canvas_thumbs.canvasy(0)
+        view_bottom = view_top + self.canvas_thumbs.winfo_height()
+        first = max(0, int(view_top // self.thumbnail_slot_height) - 1)
+        last = min(self.session.doc.page_count - 1, int(view_bottom // self.thumbnail_slot_height) + 1)
+        page_nums = [n for n in range(first, last + 1) if n not in self.thumbnails_requested]
+        if not page_nums:
+            return
+        self.thumbnails_requested.update(page_nums)
+        self.thumbnail_dispatcher.submit(self._generate_thumbnails, self.session.doc_key, self.session.path, page_nums)
+
+    def _document_file_hash(self, doc_key, path):
+        """
+        Runs on the thumbnail dispatcher thread: file hash keying the on-disk caches of a document.
+        The first lookup for a document also marks its thumbnails as recently used and prunes the
+        thumbnail cache of the least recently opened reports.
+        """
+        file_hash = self.thumbnail_file_hashes.get(doc_key)
+        if file_hash is None:
+            file_hash = self.thumbnail_file_hashes[doc_key] = file_sha1(path)
+            thumbnail_dir = thumbnail_cache_path(file_hash, 0).parent
+            try:
+                if thumbnail_dir.exists():
+                    os.utime(thumbnail_dir)
+            except OSError:
+                pass
+            prune_disk_cache(thumbnail_dir.parent, THUMBNAIL_DISK_CACHE_MAX_BYTES, keep=thumbnail_dir)
+        return file_hash
+
+    def _generate_thumbnails(self, doc_key, path, page_nums):
+        """Runs on the thumbnail dispatcher thread: serves disk-cache hits and fans the rest out to processes."""
+        try:
+            file_hash = self._document_file_hash(doc_key, path)
+            missing = []
+            for page_num in page_nums:
+                cache_path = thumbnail_cache_path(file_hash, page_num)
+                if cache_path.exists():
+                    self._post_to_ui(self._on_thumbnail_ready, doc_key, page_num, cache_path.read_bytes())
+                else:
+                    missing.append(page_num)
+            if not missing:
+                return
+            if self.thumbnail_pool is None:
+                self.thumbnail_pool = ProcessPoolExecutor(max_workers=THUMBNAIL_MAX_PROCESSES)
+            futures = [
+                self.thumbnail_pool.submit(render_thumbnails, path, file_hash, missing[i:i + THUMBNAIL_CHUNK_PAGES])
+                for i in range(0, len(missing), THUMBNAIL_CHUNK_PAGES)
+            ]
+            for future in as_completed(futures):
+                for page_num, png_bytes in future.result():
+                    self._post_to_ui(self._on_thumbnail_ready, doc_key, page_num, png_bytes)
+        except BrokenProcessPool as e:
+            self.thumbnail_pool = None
+            self._post_to_ui(self.log_error, f"Thumbnail generation failed: {e}")
+        except Exception as e:
+            self._post_to_ui(self.log_error, f"Thumbnail generation failed: {e}")
+
+    def _on_thumbnail_ready(self, doc_key, page_num, png_bytes):
+        if doc_key != self.session.doc_key or not self.thumbnail_slot_height:
+            return # Belongs to a document that has since been closed
+        thumb = Image.open(io.BytesIO(png_bytes))
+        thumb_height = self.thumbnail_slot_height - THUMBNAIL_SLOT_PADDING_PX
+        if thumb.height > thumb_height:
+            thumb = thumb.resize((max(1, int(thumb.width * thumb_height / thumb.height)), thumb_height), Image.LANCZOS)
+        tk_thumb = ImageTk.PhotoImage(thumb)
+        self.thumbnail_images[page_num] = tk_thumb
+        self.canvas_thumbs.create_image(
+            10 + THUMBNAIL_WIDTH_PX / 2, page_num * self.thumbnail_slot_height + 6,
+            anchor="n", image=tk_thumb, tags=f"thumb_img_{page_num}"
+        )
+        self._highlight_current_thumbnail()
+
+    def _build_text_index(self, doc_key, path, page_count):
+        """Runs on the thumbnail dispatcher thread: loads the cached word index or extracts it in worker processes."""
+        try:
+            file_hash = self._document_file_hash(doc_key, path)
+            cache_path = text_index_cache_path(file_hash)
+            index = TextIndex.load(cache_path)
+            if index is None or len(index.pages) != page_count:
+                if self.thumbnail_pool is None:
+                    self.thumbnail_pool = ProcessPoolExecutor(max_workers=THUMBNAIL_MAX_PROCESSES)
+                futures = [
+                    self.thumbnail_pool.submit(extract_page_words, path, list(range(i, min(i + TEXT_INDEX_CHUNK_PAGES, page_count))))
+                    for i in range(0, page_count, TEXT_INDEX_CHUNK_PAGES)
+                ]
+                pages = [[] for _ in range(page_count)]
+                for future in as_completed(futures):
+                    for page_num, words in future.result():
+                        pages[page_num] = words
+                index = TextIndex(pages)
+                index.save(cache_path)
+            self._post_to_ui(self._on_text_index_ready, doc_key, index)
+        except BrokenProcessPool as e:
+            self.thumbnail_pool = None
+            self._post_to_ui(self.log_error, f"Text indexing failed: {e}")
+        except Exception as e:
+            self._post_to_ui(self.log_error, f"Text indexing failed: {e}")
+
+    def _on_text_index_ready(self, doc_key, index):
+        if doc_key != self.session.doc_key:
+            return # Belongs to a document that has since been closed
+        self.text_index = index
+        if self.search_entry.get().strip():
+            self.find_next() # The user typed a query while the index was still being built
+        else:
+            self.search_status_label.config(text="")
+
+    def _reset_text_search(self):
+        self.text_index = None
+        self.search_query = ""
+        self.search_hits = []
+        self.search_hit_index = -1
+        self.canvas_pdf.delete("search_hit")
+        self.search_status_label.config(text="Indexing..." if self.session.doc else "")
+
+    def find_next(self):
+        self._step_search_hit(1)
+
+    def find_previous(self):
+        self._step_search_hit(-1)
+
+    def clear_search(self):
+        self.search_entry.delete(0, END)
+        self.search_query = ""
+        self.search_hits = []
+        self.search_hit_index = -1
+        self.canvas_pdf.delete("search_hit")
+        self.search_status_label.config(text="" if self.text_index or not self.session.doc else "Indexing...")
+
+    def _step_search_hit(self, direction):
+        """Moves to the next/previous hit of the query in the search box, searching again if the query changed."""
+        if not self.session.doc:
+            self.log_error("No PDF loaded.")
+            return
+        query = self.search_entry.get().strip()
+        if not query:
+            self.clear_search()
+            return
+        if self.text_index is None:
+            self.search_status_label.config(text="Indexing...")
+            return # _on_text_index_ready runs the search once the index is in
+        if query != self.search_query:
+            self.search_query = query
+            self.search_hits = self.text_index.search(query)
+            # Start from the first hit on or after the page being viewed
+            self.search_hit_index = next(
+                (i for i, (page_num, _) in enumerate(self.search_hits) if page_num >= self.current_page_num), 0
+            )
+        elif self.search_hits:
+            self.search_hit_index = (self.search_hit_index + direction) % len(self.search_hits)
+        if not self.search_hits:
+            self.search_hit_index = -1
+            self.canvas_pdf.delete("search_hit")
+            self.search_status_label.config(text="No matches")
+            return
+        self.search_status_label.config(text=f"{self.search_hit_index + 1} / {len(self.search_hits)}")
+        page_num, boxes = self.search_hits[self.search_hit_index]
+        if page_num != self.current_page_num:
+            self.go_to_page(page_num) # Rebuilds the canvas, highlights included
+        else:
+            self._draw_search_highlights()
+        self._scroll_to_box(boxes[0])
+
+    def _draw_search_highlights(self):
+        """Outlines the search hits on the current page over the page bitmap; the page itself is not re-rendered."""
+        self.canvas_pdf.delete("search_hit")
+        zoom = self.current_zoom
+        for i, (page_num, boxes) in enumerate(self.search_hits):
+            if page_num != self.current_page_num:
+                continue
+            current = i == self.search_hit_index
+            for x0, y0, x1, y1 in boxes:
+                self.canvas_pdf.create_rectangle(
+                    x0 * zoom - 2, y0 * zoom - 2, x1 * zoom + 2, y1 * zoom + 2,
+                    outline="#F47D23" if current else "#E6B800", width=3 if current else 2, tags="search_hit"
+                )
+
+    def _scroll_to_box(self, box):
+        """Scrolls the PDF canvas so a box in page points is centred where the page allows."""
+        page_rect = self.session.page_rect(self.current_page_num)
+        total_width = page_rect.width * self.current_zoom
+        total_height = page_rect.height * self.current_zoom
+        center_x = (box[0] + box[2]) / 2 * self.current_zoom
+        center_y = (box[1] + box[3]) / 2 * self.current_zoom
+        if total_width > 0:
+            self.canvas_pdf.xview_moveto(max(0, center_x - self.canvas_pdf.winfo_width() / 2) / total_width)
+        if total_height > 0:
+            self.canvas_pdf.yview_moveto(max(0, center_y - self.canvas_pdf.winfo_height() / 2) / total_height)
+        self._schedule_visible_tiles_update()
+
+    def _on_thumbnail_click(self, event):
+        if not self.session.doc or not self.thumbnail_slot_height:
+            return
+        page_num = int(self.canvas_thumbs.canvasy(event.y) // self.thumbnail_slot_height)
+        if 0 <= page_num < self.session.doc.page_count:
+            self.go_to_page(page_num)
+
+    def _use_tiled_rendering(self, page_rect):
+        width_px = page_rect.width * self.current_zoom
+        height_px = page_rect.height * self.current_zoom
+        return width_px * height_px > TILED_RENDER_MIN_PIXELS
+
+    def _schedule_visible_tiles_update(self, delay_ms=TILE_UPDATE_DELAY_MS):
+        if self.tile_update_id is not None:
+            self.root.after_cancel(self.tile_update_id)
+        self.tile_update_id = self.root.after(delay_ms, self._update_visible_tiles)
+
+    def _visible_tile_range(self, page_rect, margin_px):
+        """Returns the (cols, rows) ranges of tiles intersecting the visible canvas region grown by margin_px."""
+        page_width_px = page_rect.width * self.current_zoom
+        page_height_px = page_rect.height * self.current_zoom
+        view_x0 = self.canvas_pdf.canvasx(0) - margin_px
+        view_y0 = self.canvas_pdf.canvasy(0) - margin_px
+        view_x1 = view_x0 + self.canvas_pdf.winfo_width() + 2 * margin_px
+        view_y1 = view_y0 + self.canvas_pdf.winfo_height() + 2 * margin_px
+        last_col = max(0, int((page_width_px - 1) // TILE_SIZE_PX))
+        last_row = max(0, int((page_height_px - 1) // TILE_SIZE_PX))
+        cols = range(max(0, int(view_x0 // TILE_SIZE_PX)), min(last_col, int(view_x1 // TILE_SIZE_PX)) + 1)
+        rows = range(max(0, int(view_y0 // TILE_SIZE_PX)), min(last_row, int(view_y1 // TILE_SIZE_PX)) + 1)
+        return cols, rows
+
+    def _update_visible_tiles(self):
+        """Draws cached tiles around the viewport, requests missing ones and drops tiles far off-screen."""
+        self.tile_update_id = None
+        if not self.session.doc or self.displayed_page_key != (self.session.doc_key, self.current_page_num):
+            return
+        page_rect = self.session.page_rect(self.current_page_num)
+        if not self._use_tiled_rendering(page_rect):
+            return
+
+        cols, rows = self._visible_tile_range(page_rect, TILE_MARGIN_PX)
+        keep_cols, keep_rows = self._visible_tile_range(page_rect, 2 * TILE_MARGIN_PX)
+        for tile, (item_id, _) in list(self.displayed_tiles.items()):
+            if tile[0] not in keep_cols or tile[1] not in keep_rows:
+                self.canvas_pdf.delete(item_id)
+                del self.displayed_tiles[tile]
+
+        for tile, (item_id, _) in list(self.displayed_tile_placeholders.items()):
+            if tile[0] not in keep_cols or tile[1] not in keep_rows:
+                self.canvas_pdf.delete(item_id)
+                del self.displayed_tile_placeholders[tile]
+
+        missing_tiles = []
+        best_zoom, best = self.page_render_cache.find_best(self.session.doc_key, self.current_page_num)
+        for row in rows:
+            for col in cols:
+                tile = (col, row)
+                if tile in self.displayed_tiles:
+                    continue
+                bitmap = self.page_render_cache.get(
+                    PageRenderCache.make_key(self.session.doc_key, self.current_page_num, self.current_zoom, tile)
+                )
+                if bitmap is not None:
+                    self._draw_tile(tile, bitmap)
+                else:
+                    missing_tiles.append(tile)
+                    if best is not None:
+                        self._draw_tile_placeholder(tile, best_zoom, best['pil_img'])
+
+        for index, tile in enumerate(missing_tiles):
+            # The first submission supersedes tiles queued for an older viewport or zoom
+            self.render_worker.submit({
+                'path': self.session.path,
+                'doc_key': self.session.doc_key,
+                'page_num': self.current_page_num,
+                'zoom': self.current_zoom,
+                'tile': tile,
+                'clip': tile_clip_rect(tile[0], tile[1], self.current_zoom),
+                'keep_if_stale': True
+            }, supersede=(index == 0))
+
+    def _draw_tile_placeholder(self, tile, source_zoom, source_img):
+        """Fills a missing tile with the matching region of a lower-zoom bitmap, stretched to tile size."""
+        if tile in self.displayed_tile_placeholders:
+            return
+        scale = source_zoom / self.current_zoom
+        x0, y0 = tile[0] * TILE_SIZE_PX, tile[1] * TILE_SIZE_PX
+        # Edge tiles extend past the page; clamp to the source bitmap so no black border is stretched in
+        box = (
+            int(x0 * scale), int(y0 * scale),
+            min(source_img.width, int((x0 + TILE_SIZE_PX) * scale) + 1),
+            min(source_img.height, int((y0 + TILE_SIZE_PX) * scale) + 1)
+        )
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return
+        target_size = (max(1, round((box[2] - box[0]) / scale)), max(1, round((box[3] - box[1]) / scale)))
+        region = source_img.crop(box).resize(target_size, Image.BILINEAR)
+        tk_img = ImageTk.PhotoImage(region)
+        item_id = self.canvas_pdf.create_image(x0, y0, anchor="nw", image=tk_img, tags="page_tile_placeholder")
+        self.canvas_pdf.tag_lower(item_id)
+        self.displayed_tile_placeholders[tile] = (item_id, tk_img)
+
+    def _draw_tile(self, tile, bitmap):
+        if tile in self.displayed_tiles:
+            return
+        placeholder = self.displayed_tile_placeholders.pop(tile, None)
+        if placeholder is not None:
+            self.canvas_pdf.delete(placeholder[0])
+        item_id = self.canvas_pdf.create_image(
+            tile[0] * TILE_SIZE_PX, tile[1] * TILE_SIZE_PX, anchor="nw", image=bitmap['tk_img'], tags="page_tile"
+        )
+        self.canvas_pdf.tag_lower(item_id) # Keep page content beneath the signature overlays
+        # Hold a reference so cache eviction cannot blank a tile that is still on screen
+        self.displayed_tiles[tile] = (item_id, bitmap['tk_img'])
+
     def zoom_in(self):
-        if self.pdf_doc and self.current_zoom < 4.0:
-            self.current_zoom *= 1.25
+        if self.session.doc and self.current_zoom < 4.0:
+            self.current_zoom = quantize_zoom(self.current_zoom * 1.25)
             self.render_pdf_page()
             # Adjust view to keep center relatively stable after zoom
             self.canvas_pdf.xview_moveto(self.canvas_pdf.xview()[0] / 1.25)
             self.canvas_pdf.yview_moveto(self.canvas_pdf.yview()[0] / 1.25)
 
     def zoom_out(self):
-        if self.pdf_doc and self.current_zoom > 0.25:
-            self.current_zoom /= 1.25
+        if self.session.doc and self.current_zoom > 0.25:
+            self.current_zoom = quantize_zoom(self.current_zoom / 1.25)
             self.render_pdf_page()
             # Adjust view to keep center relatively stable after zoom
             self.canvas_pdf.xview_moveto(self.canvas_pdf.xview()[0] * 1.25)
@@ -625,6 +3435,9 @@ class HSEReportPortalApp:
                 self.drag_start_x = event.x
                 self.drag_start_y = event.y
 
+                # In tiled mode, fetch the tiles the pan is about to uncover
+                self._schedule_visible_tiles_update()
+
     def on_drag_end(self, event):
         """Resets cursor and handles signature placement if it was a click."""
         self.canvas_pdf.config(cursor="cross") # Reset cursor to crosshair
@@ -638,30 +3451,25 @@ class HSEReportPortalApp:
 
     def _place_signature_on_click(self, event):
         """Helper to place signature if the mouse event was a click (not a drag)."""
-        if not self.pdf_doc or not self.current_active_signature_data['pil_img']:
+        if not self.session.doc or not self.current_active_signature_data['pil_img']:
             self.log_error("Load a PDF and select/load a signature to place it manually. (Hint: Use dropdowns to select a name first).")
             return
 
         canvas_click_x = self.canvas_pdf.canvasx(event.x)
         canvas_click_y = self.canvas_pdf.canvasy(event.y)
 
-        page = self.pdf_doc.load_page(self.current_page_num)
-        page_height_pdf_pts = page.rect.height
-
         # Convert canvas pixel coordinates to PDF points (scaled)
         pdf_x_top_left_click = canvas_click_x / self.current_zoom
         pdf_y_top_left_click = canvas_click_y / self.current_zoom # This is Y from top of PDF page, scaled
 
         sig_pil = self.current_active_signature_data['pil_img']
-        sig_target_width_pt = 80 # Consistent signature width
-        sig_pil_aspect_ratio = sig_pil.height / sig_pil.width
-        sig_target_height_pt = sig_target_width_pt * sig_pil_aspect_ratio
-
-        # Convert canvas top-left click Y to PDF bottom-left Y for merge
-        pdf_y_bottom_left_for_merge = page_height_pdf_pts - (pdf_y_top_left_click + sig_target_height_pt)
+        sig_target_width_pt, sig_target_height_pt = SigningSession.signature_size_pt(sig_pil)
 
-        self.signature_position_pdf = (pdf_x_top_left_click, pdf_y_bottom_left_for_merge) 
-        self.log_error(f"Manual placement position set at PDF coords: ({pdf_x_top_left_click:.1f}, {pdf_y_bottom_left_for_merge:.1f}) (size: {sig_target_width_pt}x{sig_target_height_pt:.1f} pts). Click 'APPLY ESIGN'.")
+        # The clicked point is the signature's top-left corner; placements use its bottom-left corner
+        self.signature_position_pdf = self.session.bottom_left_position(
+            self.current_page_num, pdf_x_top_left_click, pdf_y_top_left_click, sig_target_height_pt
+        )
+        self.log_error(f"Manual placement position set at PDF coords: ({self.signature_position_pdf[0]:.1f}, {self.signature_position_pdf[1]:.1f}) (size: {sig_target_width_pt}x{sig_target_height_pt:.1f} pts). Click 'APPLY ESIGN'.")
 
         self.canvas_pdf.delete("sig_preview_rect")
         self.canvas_pdf.delete("sig_preview_img")
@@ -670,10 +3478,9 @@ class HSEReportPortalApp:
         preview_width_on_canvas = sig_target_width_pt * self.current_zoom
         preview_height_on_canvas = sig_target_height_pt * self.current_zoom
 
-        scaled_pil_sig_for_preview = sig_pil.resize(
-            (int(preview_width_on_canvas), int(preview_height_on_canvas)), Image.LANCZOS
+        self.temp_scaled_sig_tk = self.scaled_signature_cache.get_photo(
+            self.current_active_signature_data['name'], sig_pil, (preview_width_on_canvas, preview_height_on_canvas)
         )
-        self.temp_scaled_sig_tk = ImageTk.PhotoImage(scaled_pil_sig_for_preview) 
 
         self.canvas_pdf.create_image(canvas_click_x, canvas_click_y, anchor="nw", image=self.temp_scaled_sig_tk, tags="sig_preview_img")
 
@@ -710,129 +3517,160 @@ class HSEReportPortalApp:
             self.log_error("Could not identify the changed dropdown role.")
 
         if selected_name != "--Please select Name--":
-            try:
-                if selected_name not in self.loaded_signatures_cache:
-                    conn = mysql.connector.connect(host="localhost", user="root", password="password", database="project")
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT ESIGN FROM iocl WHERE name=%s", (selected_name,))
-                    result = cursor.fetchone()
-                    cursor.close()
-                    conn.close()
-
-                    if not result or not result[0]:
-                        self.log_error(f"No signature image found for '{selected_name}'.")
-                        self.current_active_signature_data = {'pil_img': None, 'tk_img': None, 'name': None, 'image_bytes': None}
-                        self.canvas_pdf.delete("sig_display_top_right")
-                        return
-
-                    img_bytes = result[0]
-                    pil_img = Image.open(io.BytesIO(img_bytes)).convert("RGBA")
-                    fixed_preview_width = 150
-                    fixed_preview_height = int(pil_img.height * (fixed_preview_width / pil_img.width))
-                    tk_img_for_preview = ImageTk.PhotoImage(pil_img.resize((fixed_preview_width, fixed_preview_height), Image.LANCZOS))
-                    
-                    self.loaded_signatures_cache[selected_name] = {
-                        'pil_img': pil_img, 'tk_img': tk_img_for_preview, 'name': selected_name, 'image_bytes': img_bytes
-                    }
-                
-                cached_data = self.loaded_signatures_cache[selected_name]
-                self.current_active_signature_data = {
-                    'pil_img': cached_data['pil_img'],
-                    'tk_img': cached_data['tk_img'],
-                    'name': selected_name,
-                    'image_bytes': cached_data['image_bytes']
-                }
-                self.render_pdf_page()
-            except Exception as e:
-                self.log_error(f"Error loading single signature preview for '{selected_name}': {e}")
-                self.current_active_signature_data = {'pil_img': None, 'tk_img': None, 'name': None, 'image_bytes': None}
-                self.canvas_pdf.delete("sig_display_top_right")
+            # Warm every assigned officer's e-sign with one background query, including this one
+            self._warm_signatures_async(list(self.selected_officer_assignments.values()) + [selected_name])
+            cached_data = self.loaded_signatures_cache.get(selected_name)
+            if cached_data is not None:
+                self.pending_active_signature_name = None
+                self._activate_signature(cached_data)
+            else:
+                # Becomes active for manual placement as soon as the background fetch delivers it
+                self.pending_active_signature_name = selected_name
+                self._clear_active_signature()
+                self._draw_signature_loading_indicator(selected_name)
         else:
-            self.current_active_signature_data = {'pil_img': None, 'tk_img': None, 'name': None, 'image_bytes': None}
-            self.canvas_pdf.delete("sig_display_top_right")
+            self.pending_active_signature_name = None
+            self._clear_active_signature()
+        self._cancel_unneeded_signature_batches()
+
+    def _store_signature(self, name, img_bytes, pil_img=None):
+        """
+        Adds an ingested e-sign (plus its fixed-width top-right preview) to loaded_signatures_cache.
+        img_bytes is the compact encoded variant from ingest_signature, not the raw database BLOB.
+        """
+        if pil_img is None:
+            img_bytes, pil_img = ingest_signature(img_bytes)
+        fixed_preview_width = 150
+        fixed_preview_height = int(pil_img.height * (fixed_preview_width / pil_img.width))
+        tk_img_for_preview = ImageTk.PhotoImage(pil_img.resize((fixed_preview_width, fixed_preview_height), Image.LANCZOS))
+        self.scaled_signature_cache.invalidate(name)
+        return self.loaded_signatures_cache.put(name, {
+            'pil_img': pil_img, 'tk_img': tk_img_for_preview, 'name': name, 'image_bytes': img_bytes
+        })
+
+    def _activate_signature(self, cached_data):
+        """Makes a cached e-sign the active one for manual click placement."""
+        self.current_active_signature_data = {
+            'pil_img': cached_data['pil_img'],
+            'tk_img': cached_data['tk_img'],
+            'name': cached_data['name'],
+            'image_bytes': cached_data['image_bytes']
+        }
+        # The click preview showed the previous signature; only the preview items are redrawn
+        self.canvas_pdf.delete("sig_preview_rect")
+        self.canvas_pdf.delete("sig_preview_img")
+        self._draw_active_signature_preview()
 
-    def load_signature(self):
-        """Automated placement of selected signatures based on predefined coordinates."""
-        if not self.pdf_doc:
+    def _clear_active_signature(self):
+        self.current_active_signature_data = {'pil_img': None, 'tk_img': None, 'name': None, 'image_bytes': None}
+        self.canvas_pdf.delete("sig_display_top_right")
+
+    def _draw_signature_loading_indicator(self, name):
+        """Placeholder in the top-right preview slot while an officer's e-sign is loading."""
+        if not self.session.doc:
+            return
+        canvas_width = self.canvas_pdf.winfo_width()
+        if canvas_width <= 1:
+            canvas_width = self.root.winfo_width() / 2 - 10
+        self.canvas_pdf.create_text(
+            canvas_width - 10, 10, anchor="ne", text=f"Loading signature: {name}...",
+            font=("Inter", 10, "bold"), fill="#808080", tags="sig_display_top_right"
+        )
+
+    def _warm_signatures_async(self, names):
+        """Fetches and decodes uncached e-signs for names in one batched query on a background thread."""
+        missing = [
+            name for name in dict.fromkeys(names)
+            if name not in self.loaded_signatures_cache and name not in self.signatures_in_flight
+        ]
+        if not missing:
+            return
+        self.signatures_in_flight.update(missing)
+        future = self.db_executor.submit(self._fetch_signature_batch, missing)
+        self.signature_batches.append((future, missing))
+
+    def _cancel_unneeded_signature_batches(self):
+        """Cancels queued e-sign fetches that no current dropdown selection needs any more."""
+        wanted = set(self.selected_officer_assignments.values())
+        if self.pending_active_signature_name:
+            wanted.add(self.pending_active_signature_name)
+        for future, names in list(self.signature_batches):
+            # Only batches that have not started can be cancelled; running ones are simply cached on arrival
+            if not wanted.intersection(names) and future.cancel():
+                self.signatures_in_flight.difference_update(names)
+                self.signature_batches.remove((future, names))
+
+    def _fetch_signature_batch(self, names):
+        # Runs on a db_executor thread: no Tk calls here, results are posted back to the Tk thread
+        try:
+            decoded, errors = load_signatures(self.officer_repository, self.signature_disk_cache, names)
+        except Exception as e:
+            decoded, errors = {}, [f"Error loading signatures: {e}"]
+        self._post_to_ui(self._on_signature_batch_loaded, names, decoded, errors)
+
+    def _on_signature_batch_loaded(self, names, decoded, errors):
+        self.signatures_in_flight.difference_update(names)
+        self.signature_batches = [(future, batch) for future, batch in self.signature_batches if batch is not names]
+        stored = {name: self._store_signature(name, img_bytes, pil_img) for name, (img_bytes, pil_img) in decoded.items()}
+        pending_name = self.pending_active_signature_name
+        if pending_name in names:
+            self.pending_active_signature_name = None
+            if pending_name in stored:
+                self._activate_signature(stored[pending_name])
+            elif not errors:
+                self.log_error(f"No signature image found for '{pending_name}'.")
+        if errors:
+            self.log_error("\n".join(errors))
+        if self.auto_placement_pending and not self.signatures_in_flight.intersection(self.selected_officer_assignments.values()):
+            self.auto_placement_pending = False
+            self.load_signature(fetch_missing=False)
+
+    def load_signature(self, fetch_missing=True):
+        """
+        Automated placement of selected signatures based on predefined coordinates.
+        E-signs that are not cached yet are loaded in the background first; placement then resumes
+        from _on_signature_batch_loaded with fetch_missing=False.
+        """
+        if self._block_while_saving():
+            return
+        if not self.session.doc:
             self.log_error("No PDF loaded.")
             return
         if not self.selected_officer_assignments:
             self.log_error("No officers selected from dropdowns for auto-placement. Select names first.")
             return
 
-        self.placed_signatures = {}
-
-        placement_count = 0
-        errors_during_placement = []
-
-        page = self.pdf_doc.load_page(self.current_page_num)
-        page_height_pdf_pts = page.rect.height
-        sig_target_width_pt = 80
-
-        for role_title, name_to_place in self.selected_officer_assignments.items():
-            if role_title not in self.esign_coordinates:
-                errors_during_placement.append(f"No predefined coordinates for role: '{role_title}'. Skipping '{name_to_place}'.")
-                continue
-
-            try:
-                pil_img = None
-                if name_to_place in self.loaded_signatures_cache:
-                    pil_img = self.loaded_signatures_cache[name_to_place]['pil_img']
-                else:
-                    conn = mysql.connector.connect(host="localhost", user="root", password="password", database="project")
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT ESIGN FROM iocl WHERE name=%s", (name_to_place,))
-                    result = cursor.fetchone() 
-                    cursor.close()
-                    conn.close()
-
-                    if not result or not result[0]:
-                        errors_during_placement.append(f"No signature image found for '{name_to_place}'. Skipping placement.")
-                        continue
-                    
-                    img_bytes = result[0]
-                    pil_img = Image.open(io.BytesIO(img_bytes)).convert("RGBA")
-
-                    fixed_preview_width = 150
-                    fixed_preview_height = int(pil_img.height * (fixed_preview_width / pil_img.width))
-                    tk_img_for_preview = ImageTk.PhotoImage(pil_img.resize((fixed_preview_width, fixed_preview_height), Image.LANCZOS))
-                    self.loaded_signatures_cache[name_to_place] = {
-                        'pil_img': pil_img, 'tk_img': tk_img_for_preview, 'name': name_to_place, 'image_bytes': img_bytes
-                    }
-
-                # Use the coordinates directly as they are assumed to be (x from left, y from bottom)
-                pdf_x, pdf_y = self.esign_coordinates[role_title]
-                
-                sig_pil_aspect_ratio = pil_img.height / pil_img.width
-                sig_target_height_pt = sig_target_width_pt * sig_pil_aspect_ratio
-                
-                placement_position = (pdf_x, pdf_y) # Directly use the provided bottom-left coordinate
+        assigned_names = list(dict.fromkeys(self.selected_officer_assignments.values()))
+        if fetch_missing and any(name not in self.loaded_signatures_cache for name in assigned_names):
+            self.auto_placement_pending = True
+            self._warm_signatures_async(assigned_names)
+            self.log_error("Loading signatures for the selected officers... They will be placed automatically.")
+            return
 
-                if self.current_page_num not in self.placed_signatures:
-                    self.placed_signatures[self.current_page_num] = []
-                
-                self.placed_signatures[self.current_page_num].append({
-                    'pil_img': pil_img,
-                    'position': placement_position,
-                    'target_width_pt': sig_target_width_pt,
-                    'target_height_pt': sig_target_height_pt,
-                    'name': name_to_place
-                })
-                placement_count += 1
+        # Re-running auto-placement replaces this page's signatures only; other pages keep theirs
+        for sig_info in self.session.placements.get(self.current_page_num, []):
+            self._remove_signature_overlay(sig_info)
+        self.selected_placed_signature = None
 
-            except Exception as e:
-                errors_during_placement.append(f"Error placing signature for '{name_to_place}' ({role_title}): {e}")
+        placed, errors_during_placement, slot_source = self.session.place_roles(
+            self.current_page_num, self.selected_officer_assignments
+        )
+        if slot_source == "default":
+            errors_during_placement.insert(0, "No role labels found on this page; used the default slot positions, please check them.")
+        for sig_info in placed:
+            self._show_placed_signature(sig_info)
+        placement_count = len(placed)
 
         if errors_during_placement:
             self.log_error(f"Completed placing {placement_count} signature(s). Issues encountered:\n" + "\n".join(errors_during_placement))
         else:
             self.log_error(f"Successfully placed {placement_count} signature(s). Click 'SAVE PDF' to finalize.")
-        
-        self.render_pdf_page()
 
     def apply_signature(self):
         """Applies the manually positioned active signature."""
-        if not self.pdf_doc:
+        if self._block_while_saving():
+            return
+        if not self.session.doc:
             self.log_error("No PDF loaded.")
             return
         if not self.signature_position_pdf:
@@ -842,103 +3680,271 @@ class HSEReportPortalApp:
             self.log_error("No active signature selected/loaded for manual placement. Select a name from dropdown first.")
             return
 
-        active_pil_img = self.current_active_signature_data['pil_img']
         active_name = self.current_active_signature_data['name']
+        # signature_position_pdf is already the bottom-left corner (see _place_signature_on_click)
+        self._show_placed_signature(self.session.place(
+            self.current_page_num, active_name, self.signature_position_pdf, self.current_active_signature_data
+        ))
 
-        sig_target_width_pt = 80
-        sig_pil_aspect_ratio = active_pil_img.height / active_pil_img.width
-        sig_target_height_pt = sig_target_width_pt * sig_pil_aspect_ratio
-
-        if self.current_page_num not in self.placed_signatures:
-            self.placed_signatures[self.current_page_num] = []
-        
-        self.placed_signatures[self.current_page_num].append({
-            'pil_img': active_pil_img,
-            'position': self.signature_position_pdf, # This is already bottom-left origin from _place_signature_on_click
-            'target_width_pt': sig_target_width_pt,
-            'target_height_pt': sig_target_height_pt,
-            'name': active_name
-        })
-
+        # The click preview is now a placed signature
+        self.canvas_pdf.delete("sig_preview_rect")
+        self.canvas_pdf.delete("sig_preview_img")
         self.signature_position_pdf = None
         self.log_error(f"Manually placed signature '{active_name}' on page {self.current_page_num + 1}. Click on PDF to place another or 'SAVE PDF'.")
-        self.render_pdf_page()
+
+    def _block_while_saving(self):
+        """Returns True (and says so) if a save is running; used by actions that would change the document or placements."""
+        if self.save_in_progress:
+            self.log_error("A save is in progress. Please wait until it has finished.")
+            return True
+        return False
 
     def save_pdf(self):
-        if not self.pdf_doc:
+        if self._block_while_saving():
+            return
+        if not self.session.doc:
             self.log_error("No PDF to save.")
             return
-        if not self.placed_signatures:
+        if not self.session.has_placements():
             self.log_error("No signatures have been placed on the PDF yet. Nothing to save.")
             return
 
-        save_path = filedialog.asksaveasfilename(
-            defaultextension=".pdf",
-            filetypes=[("PDF Files", "*.pdf")],
-            title="Save PDF as"
+        save_mode = self.save_mode_combobox.get()
+        if save_mode == SAVE_MODE_APPEND_IN_PLACE:
+            if not messagebox.askyesno(
+                "Append in place",
+                f"The signatures will be appended to the original file:\n{self.session.path}\n\nContinue?"
+            ):
+                return
+            save_path = self.session.path
+        else:
+            save_path = filedialog.asksaveasfilename(
+                defaultextension=".pdf",
+                filetypes=[("PDF Files", "*.pdf")],
+                title="Save PDF as"
+            )
+            if not save_path:
+                return
+
+        # The worker process only gets plain data: PIL and Tk images stay here
+        placements = self.session.portable_placements()
+        replaces_open_file = Path(save_path).resolve() == Path(self.session.path).resolve()
+        if replaces_open_file:
+            # Keep showing the report from memory while its file is rewritten
+            self.session.release_file()
+        self.save_in_progress = True
+        self.btn_save_pdf.config(state="disabled")
+        self._on_save_progress(0, len(placements))
+        self.save_progress_label.grid()
+        self.save_progress_bar.grid()
+        self.save_dispatcher.submit(
+            self._run_save_job, self.session.path, placements, save_path, save_mode, replaces_open_file
         )
-        if not save_path:
-            return
 
+    def _run_save_job(self, source_path, placements, save_path, save_mode, replaces_open_file=False):
+        """Runs on the save dispatcher thread: hands the save to the worker process and relays its progress."""
+        if replaces_open_file:
+            self.render_worker.pause() # The render process must let go of the file before it is replaced
         try:
-            from PyPDF2 import PdfFileReader, PdfFileWriter
-            from reportlab.pdfgen import canvas as rp_canvas
-            from reportlab.lib.utils import ImageReader
-
-            original_pdf_bytes = self.pdf_doc.tobytes()
-            reader = PdfFileReader(io.BytesIO(original_pdf_bytes))
-            writer = PdfFileWriter()
-
-            for i in range(reader.getNumPages()):
-                page = reader.getPage(i)
-                
-                if i in self.placed_signatures:
-                    for sig_info in self.placed_signatures[i]:
-                        pil_img_to_merge = sig_info['pil_img']
-                        pos_x, pos_y = sig_info['position']
-                        target_width_pt = sig_info['target_width_pt']
-                        target_height_pt = sig_info['target_height_pt']
-
-                        packet = io.BytesIO()
-                        c = rp_canvas.Canvas(packet, pagesize=(target_width_pt, target_height_pt))
-                        c.drawImage(
-                            ImageReader(pil_img_to_merge.resize((int(target_width_pt), int(target_height_pt)), Image.LANCZOS)),
-                            0, 0, width=target_width_pt, height=target_height_pt, mask='auto'
-                        )
-                        c.save()
-                        packet.seek(0)
-                        
-                        sig_reader = PdfFileReader(packet)
-                        sig_page = sig_reader.getPage(0)
-
-                        page.mergeTransformedPage(
-                            sig_page,
-                            (1, 0, 0, 1, pos_x, pos_y)
-                        )
-
-                writer.addPage(page)
-
-            with open(save_path, "wb") as output_file:
-                writer.write(output_file)
-
-            self.pdf_doc.close()
-            self.pdf_doc = fitz.open(save_path)
-            self.current_zoom = 1.0
-            self.current_page_num = 0
-            self.signature_position_pdf = None
-            self.placed_signatures = {}
+            if self.save_pool is None:
+                self.save_progress_queue = multiprocessing.Queue()
+                self.save_pool = ProcessPoolExecutor(
+                    max_workers=1, initializer=_init_save_worker, initargs=(self.save_progress_queue,)
+                )
+            while not self.save_progress_queue.empty(): # Late progress from the previous save
+                self.save_progress_queue.get_nowait()
+            future = self.save_pool.submit(run_save_job, source_path, placements, save_path, save_mode)
+            while True:
+                try:
+                    self._post_to_ui(self._on_save_progress, *self.save_progress_queue.get(timeout=0.1))
+                except queue.Empty:
+                    if future.done():
+                        break
+            self._post_to_ui(self._on_save_finished, source_path, save_path, save_mode, future.result(), None)
+        except BrokenProcessPool as e:
+            self.save_pool = None
+            self._post_to_ui(self._on_save_finished, source_path, save_path, save_mode, None, e)
+        except Exception as e:
+            self._post_to_ui(self._on_save_finished, source_path, save_path, save_mode, None, e)
+        finally:
+            if replaces_open_file:
+                self.render_worker.resume()
+
+    def _on_save_progress(self, pages_done, pages_total):
+        self.save_progress_bar.config(maximum=max(1, pages_total), value=pages_done)
+        if pages_done < pages_total:
+            self.save_progress_label.config(text=f"Signing page {pages_done + 1} of {pages_total}...")
+        else:
+            self.save_progress_label.config(text="Writing file...")
+
+    def _on_save_finished(self, source_path, save_path, save_mode, used_mode, error):
+        self.save_in_progress = False
+        self.btn_save_pdf.config(state="normal")
+        self.save_progress_label.grid_remove()
+        self.save_progress_bar.grid_remove()
+        if error is not None:
+            self.log_error(f"Error saving PDF with signatures: {error}")
+            return
+        if used_mode != save_mode:
+            self.log_error(f"'{source_path}' cannot be updated incrementally; saved with a full rewrite instead.")
+
+        if self.session.path == source_path:
+            # Continue on the saved file. Until its render arrives, the bitmap on screen plus the
+            # placed-signature images look exactly like the signed page; the images are tagged
+            # 'saved_sig' and go together with the old bitmap (see render_pdf_page), so the
+            # signatures are never drawn twice. Only the dashed placement borders go right away.
+            view_was_current = self._is_current_view_displayed()
+            old_doc_key = self.session.doc_key
+            stamped_pages = {page_num for page_num, placements in self.session.placements.items() if placements}
+            self.session.open(save_path) # The placements are part of the saved file now
+            # Apart from the stamped pages the saved file looks exactly like the old one, so its
+            # page bitmaps and thumbnails carry over; only the stamped pages are rendered again
+            self.page_render_cache.rekey_document(old_doc_key, self.session.doc_key, stamped_pages)
+            self.selected_placed_signature = None
+            self.canvas_pdf.delete("placed_sig_border")
+            self.canvas_pdf.addtag_withtag("saved_sig", "placed_sig")
+            current_page_stamped = self.current_page_num in stamped_pages
+            tiled = self._use_tiled_rendering(self.session.page_rect(self.current_page_num))
+            if view_was_current and not (tiled and current_page_stamped):
+                # Unchanged pages keep their bitmap or tiles; a stamped page swaps in its sharp render, no preview pass
+                self.displayed_view_key = (self.session.doc_key, self.current_page_num, quantize_zoom(self.current_zoom))
+                self.displayed_page_key = (self.session.doc_key, self.current_page_num)
+            else:
+                # Tiles of a stamped page, or a view still waiting on a render of the old file: redraw from scratch
+                self.displayed_view_key = None
             self.render_pdf_page()
-            self.log_error(f"PDF saved successfully with all signatures: {save_path}")
-            messagebox.showinfo("Saved", f"PDF saved successfully:\n{save_path}")
-
+            for page_num in stamped_pages:
+                self.thumbnails_requested.discard(page_num)
+                self.thumbnail_images.pop(page_num, None)
+                self.canvas_thumbs.delete(f"thumb_img_{page_num}")
+            self._schedule_thumbnail_update()
+            self._update_page_indicator()
+        self.log_error(f"PDF saved successfully with all signatures: {save_path}")
+        # Shown after this callback returns, so the dialog does not hold up other queued UI updates
+        self.root.after_idle(messagebox.showinfo, "Saved", f"PDF saved successfully:\n{save_path}")
+
+
+def main(argv=None):
+    multiprocessing.freeze_support() # Render workers re-launch this module when frozen into an executable
+    parser = argparse.ArgumentParser(description="HSE Report Portal")
+    parser.add_argument(
+        "--benchmark-save", nargs="*", metavar="PDF",
+        help="Time the PyMuPDF save engine against the legacy PyPDF2 + ReportLab path "
+             "(defaults to the PDFs in samples_pdf) and exit"
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per file and engine for --benchmark-save")
+    parser.add_argument("--batch-sign", metavar="INPUT_DIR", help="Sign every PDF in INPUT_DIR without the GUI and exit")
+    parser.add_argument("--output-dir", metavar="DIR", help="Where --batch-sign writes the signed reports")
+    parser.add_argument("--watch", metavar="INBOX", help="Keep signing new reports dropped into INBOX (runs until interrupted)")
+    parser.add_argument("--outbox", metavar="DIR", help="Where --watch writes the signed reports")
+    parser.add_argument("--quarantine", metavar="DIR", help="Where --watch moves reports that keep failing (default: INBOX/quarantine)")
+    parser.add_argument("--archive", metavar="DIR", help="Where --watch moves the signed originals (default: OUTBOX/originals)")
+    parser.add_argument("--pattern", default="HSE_Report*.pdf", help="File name pattern --watch picks up (default: %(default)s)")
+    parser.add_argument("--queue-size", type=int, default=8, help="Reports --watch queues ahead of the workers (default: %(default)s)")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="Seconds between inbox scans (default: %(default)s)")
+    parser.add_argument("--max-attempts", type=int, default=3, help="Attempts before --watch quarantines a report (default: %(default)s)")
+    parser.add_argument(
+        "--assign", action="append", default=[], metavar="ROLE=NAME",
+        help=f"Officer signing a role, repeatable. Roles: {', '.join(SIGNATURE_ROLES)}"
+    )
+    parser.add_argument("--assignments", metavar="JSON", help="File with a {role: officer name} object (merged with --assign)")
+    parser.add_argument("--page", type=int, default=1, help="Page to sign, 1-based; negative counts from the end (default: 1)")
+    parser.add_argument("--save-mode", choices=[SAVE_MODE_FULL, SAVE_MODE_APPEND_COPY], default=SAVE_MODE_FULL)
+    parser.add_argument("--workers", type=int, help="Worker processes for --batch-sign/--watch (default: CPU count, 2 for --watch)")
+    parser.add_argument("--report", metavar="JSON", help="Also write the --batch-sign results to this file")
+    parser.add_argument("--index", nargs="*", metavar="FOLDER", help="Update the report catalog for FOLDERs (default: HSE_REPORT_DIRS) and exit")
+    parser.add_argument("--find", action="store_true", help="List catalogued reports matching the filters below and exit")
+    parser.add_argument("--date-from", metavar="DD.MM.YYYY", help="--find: reports dated on or after this day")
+    parser.add_argument("--date-to", metavar="DD.MM.YYYY", help="--find: reports dated on or before this day")
+    parser.add_argument("--officer", metavar="NAME", help="--find: reports signed by an officer whose name contains NAME")
+    parser.add_argument("--status", choices=["signed", "unsigned"], help="--find: signing status")
+    parser.add_argument("--text", help="--find: text contained in the path or title")
+    parser.add_argument("--catalog-db", default=str(REPORT_CATALOG_PATH), help="Report catalog database (default: %(default)s)")
+    parser.add_argument("--check-db", action="store_true", help="Check the officer database connection pool and exit")
+    args = parser.parse_args(argv)
+
+    if args.check_db:
+        try:
+            count = OfficerRepository().check()
         except Exception as e:
-            self.log_error(f"Error saving PDF with signatures: {e}\n\n"
-                            f"Please ensure:\n"
-                            f"1. PyPDF2 (version 2.12.1 suggested for this code) is installed (pip install PyPDF2==2.12.1)\n"
-                            f"2. ReportLab is installed (pip install reportlab)\n"
-                            f"If issues persist, consider a clean reinstallation: pip uninstall PyPDF2; pip install PyPDF2==2.12.1")
+            sys.exit(f"Database check failed: {e}")
+        print(f"Database OK: {count} officer(s)")
+        return
+
+    if args.benchmark_save is not None:
+        pdf_paths = args.benchmark_save or sorted((Path(__file__).parent / "samples_pdf").glob("*.pdf"))
+        benchmark_save(pdf_paths, repeats=args.repeats)
+        return
+
+    if args.index is not None or args.find:
+        dates = {}
+        for option in ("date_from", "date_to"):
+            value = getattr(args, option)
+            dates[option] = find_report_date(value) if value else None
+            if value and dates[option] is None:
+                parser.error(f"--{option.replace('_', '-')} expects DD.MM.YYYY, got '{value}'")
+        catalog = ReportCatalog(args.catalog_db)
+        try:
+            if args.index is not None:
+                folders = [Path(p) for p in args.index] or REPORT_DIRS
+                if not folders:
+                    parser.error("--index needs FOLDERs or HSE_REPORT_DIRS")
+                start = time.perf_counter()
+                counts = catalog.update(folders, args.workers)
+                print(f"Catalog: {counts['indexed']} indexed, {counts['removed']} removed, "
+                      f"{counts['unchanged']} unchanged in {time.perf_counter() - start:.2f}s")
+            if args.find:
+                results = catalog.search(dates['date_from'], dates['date_to'], args.officer, args.status, args.text)
+                for result in results:
+                    print(f"{result['report_date'] or '----------'}  {result['status']:<8}  {result['path']}"
+                          f"{'  [' + ', '.join(result['officers']) + ']' if result['officers'] else ''}")
+                print(f"{len(results)} report(s)")
+        finally:
+            catalog.close()
+        return
+
+    if args.batch_sign or args.watch:
+        if args.batch_sign and not args.output_dir:
+            parser.error("--batch-sign requires --output-dir")
+        if args.watch and not args.outbox:
+            parser.error("--watch requires --outbox")
+        assignments = {}
+        if args.assignments:
+            assignments.update(json.loads(Path(args.assignments).read_text(encoding="utf-8")))
+        for assignment in args.assign:
+            role, sep, name = assignment.partition("=")
+            if not sep or not name.strip():
+                parser.error(f"--assign expects ROLE=NAME, got '{assignment}'")
+            assignments[role.strip()] = name.strip()
+        if not assignments:
+            parser.error("--batch-sign and --watch need at least one --assign or --assignments")
+        page_index = args.page - 1 if args.page > 0 else args.page
+
+    if args.watch:
+        try:
+            daemon = WatchFolderDaemon(
+                args.watch, args.outbox, assignments, args.quarantine, args.archive, args.pattern,
+                args.workers or 2, args.queue_size, args.poll_interval, args.max_attempts, page_index, args.save_mode
+            )
+            daemon.run()
+        except ValueError as e:
+            parser.exit(2, f"{e}\n")
+        return
+
+    if args.batch_sign:
+        try:
+            results, wall_seconds = batch_sign(
+                args.batch_sign, args.output_dir, assignments, args.workers, page_index, args.save_mode
+            )
+        except ValueError as e:
+            parser.exit(2, f"{e}\n")
+        print_batch_summary(results, wall_seconds)
+        if args.report:
+            Path(args.report).write_text(json.dumps({'wall_seconds': wall_seconds, 'results': results}, indent=2), encoding="utf-8")
+        if any(r['status'] != "ok" for r in results):
+            sys.exit(1)
+        return
 
-def main():
     root = Tk()
     app = HSEReportPortalApp(root)
     root.mainloop()